@@ -11,20 +11,36 @@ import os
 import asyncio
 import aiohttp
 import json
+import sqlite3
 import time
 import re
+import random
+import functools
+import threading
+import weakref
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, NotFoundError
 from google.oauth2.credentials import Credentials as OAuthCredentials
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-import traceback
+from googleapiclient.model import JsonModel
+import logging
 from datetime import datetime, timezone, timedelta
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+# Optional faster JSON parsing for Google, Brave and tool-call payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parses str or bytes; orjson's decode error subclasses json.JSONDecodeError
+json_loads = orjson.loads if orjson else json.loads
+
 # Load environment variables
 load_dotenv()
 
@@ -81,6 +97,15 @@ VIVIAN_CONFIG = {
 # Constants for reducing redundant messaging
 CALENDAR_UNAVAILABLE_MSG = "Work calendar integration not available"
 
+# Keyword sets for classifying work events (matched against whole words in the title)
+MEETING_KEYWORDS = frozenset({'meeting', 'meetings', 'call', 'calls', 'sync', 'standup', 'standups', 'review', 'reviews'})
+MEDIA_KEYWORDS = frozenset({'interview', 'interviews', 'media', 'press', 'pr'})
+HIGH_VISIBILITY_KEYWORDS = frozenset({'presentation', 'presentations', 'demo', 'demos', 'launch'})
+WORD_RE = re.compile(r'\w+')
+
+# Vivian works on Toronto time - build the timezone once instead of per call
+TORONTO_TZ = pytz.timezone('America/Toronto')
+
 ASSISTANT_CONFIG = VIVIAN_CONFIG
 
 # Environment variables with fallbacks
@@ -89,10 +114,20 @@ ASSISTANT_ID = os.getenv("VIVIAN_ASSISTANT_ID") or os.getenv("ASSISTANT_ID")
 BRAVE_API_KEY = os.getenv('BRAVE_API_KEY')
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Verbose per-call logging (arguments, run events, message previews) - set VIVIAN_DEBUG=1.
+# logger.debug defers formatting, so these cost nothing when the level is off
+logger = logging.getLogger('vivian')
+logger.setLevel(logging.DEBUG if os.getenv('VIVIAN_DEBUG') == '1' else logging.INFO)
+
 # Work Calendar integration (OAuth2 like Rose)
 GMAIL_TOKEN_JSON = os.getenv('GMAIL_TOKEN_JSON')
 GMAIL_WORK_CALENDAR_ID = os.getenv('GMAIL_WORK_CALENDAR_ID')  # Work calendar only
 
+# Briefing notes (Google Sheet, with a local file fallback)
+VIVIAN_DRIVE_FILE_ID = os.getenv('VIVIAN_DRIVE_FILE_ID', '1s42vLc5n3VildpkdVdBMyMNFPzBcXqggqlB4E758Nq4')
+VIVIAN_SHEET_GID = os.getenv('VIVIAN_SHEET_GID', '747232342')  # Default to the gid from your URL
+BRIEFING_NOTES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vivian_work_briefings.txt")
+
 # OAuth scopes (same as Rose to avoid token refresh issues)
 CALENDAR_SCOPES = [
     'https://www.googleapis.com/auth/gmail.readonly',
@@ -123,26 +158,47 @@ try:
     bot = commands.Bot(command_prefix='!', intents=intents, help_command=None)
     
     # Scheduler for automated briefings
-    scheduler = AsyncIOScheduler(timezone=pytz.timezone('America/Toronto'))
+    scheduler = AsyncIOScheduler(timezone=TORONTO_TZ)
 except Exception as e:
     print(f"❌ CRITICAL: Discord bot initialization failed: {e}")
     exit(1)
 
-# OpenAI setup
+# Per-request timeout for OpenAI calls (seconds). The SDK default is 10 minutes, far past
+# anything a Discord reply can wait for; whole runs are bounded by RUN_TIMEOUT_SECONDS
+OPENAI_TIMEOUT_SECONDS = 30
+
+# OpenAI setup (async client, so Assistant calls never block the event loop).
+# One client for the whole process, so its keep-alive connection pool is shared by every request
 try:
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = AsyncOpenAI(api_key=OPENAI_API_KEY, timeout=OPENAI_TIMEOUT_SECONDS, max_retries=2)
 except Exception as e:
     print(f"❌ CRITICAL: OpenAI client initialization failed: {e}")
     exit(1)
 
+class FastJsonModel(JsonModel):
+    """Google API response model that parses JSON bodies with orjson"""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
+# Falls back to googleapiclient's stdlib JSON model when orjson isn't installed
+GOOGLE_API_MODEL = FastJsonModel() if orjson else None
+
 # Google Calendar and Gmail setup (OAuth2 like Rose)
 calendar_service = None
 gmail_service = None
+sheets_service = None  # Briefing notes sheet, same credentials
 accessible_calendars = []
 
 def initialize_google_services():
     """Initialize Google Calendar and Gmail services using OAuth2 credentials"""
-    global calendar_service, gmail_service, accessible_calendars
+    global calendar_service, gmail_service, sheets_service, accessible_calendars
     
     print("🔧 Initializing Google Calendar with OAuth2...")
     
@@ -186,8 +242,9 @@ def initialize_google_services():
             return False
         
         # Initialize calendar and Gmail services
-        calendar_service = build('calendar', 'v3', credentials=oauth_credentials)
-        gmail_service = build('gmail', 'v1', credentials=oauth_credentials)
+        calendar_service = build('calendar', 'v3', credentials=oauth_credentials, model=GOOGLE_API_MODEL)
+        gmail_service = build('gmail', 'v1', credentials=oauth_credentials, model=GOOGLE_API_MODEL)
+        sheets_service = build('sheets', 'v4', credentials=oauth_credentials, model=GOOGLE_API_MODEL)
         print("✅ OAuth Calendar and Gmail services initialized")
         
         # Test work calendar and Gmail access
@@ -255,13 +312,168 @@ def test_gmail_access():
     except Exception as e:
         print(f"❌ 📧 Gmail: Error testing access - {e}")
 
-# Initialize Google services on startup
-initialize_google_services()
+GOOGLE_INIT_ATTEMPTS = 3
+
+async def ensure_google_services():
+    """Initialize Google services once, off the event loop, retrying transient failures"""
+    if calendar_service and gmail_service:
+        return True
+    
+    for attempt in range(GOOGLE_INIT_ATTEMPTS):
+        if await asyncio.to_thread(initialize_google_services):
+            return True
+        if not GMAIL_TOKEN_JSON or attempt == GOOGLE_INIT_ATTEMPTS - 1:
+            break
+        delay = 2 ** attempt
+        print(f"⏳ Retrying Google services initialization in {delay}s...")
+        await asyncio.sleep(delay)
+    return False
+
+class LRUDict(OrderedDict):
+    """Dict bounded to max_size entries, evicting the least recently used"""
+    
+    def __init__(self, max_size, on_evict=None):
+        super().__init__()
+        self.max_size = max_size
+        self.on_evict = on_evict
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def get(self, key, default=None):
+        # dict.get skips __getitem__, so lookups through it have to count as use too
+        if key in self:
+            return self[key]
+        return default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_size:
+            evicted_key, evicted_value = self.popitem(last=False)
+            if self.on_evict:
+                self.on_evict(evicted_key, evicted_value)
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-flight
+background_tasks = set()
+
+def run_in_background(coro):
+    """Schedule a fire-and-forget coroutine on the running loop, if there is one"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        coro.close()
+        return
+    task = loop.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+# User thread ids persist to SQLite so a restart resumes existing conversations
+THREAD_DB_PATH = os.getenv('VIVIAN_THREAD_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), "vivian_threads.db"))
+thread_db = None
+thread_db_lock = threading.Lock()
+
+def get_thread_db():
+    """Open the thread id store on first use (caller holds thread_db_lock)"""
+    global thread_db
+    if thread_db is None:
+        thread_db = sqlite3.connect(THREAD_DB_PATH, check_same_thread=False)
+        # WAL keeps readers from waiting on a write; NORMAL sync is durable enough for a cache of ids
+        thread_db.execute("PRAGMA journal_mode=WAL")
+        thread_db.execute("PRAGMA synchronous=NORMAL")
+        thread_db.execute(
+            "CREATE TABLE IF NOT EXISTS user_threads "
+            "(user_id TEXT PRIMARY KEY, thread_id TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        thread_db.commit()
+    return thread_db
+
+def load_thread_id(user_id):
+    """Stored thread id for a user, or None"""
+    try:
+        with thread_db_lock:
+            row = get_thread_db().execute(
+                "SELECT thread_id FROM user_threads WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        print(f"⚠️ Thread store read failed: {e}")
+        return None
+
+def save_thread_id(user_id, thread_id):
+    """Store a user's thread id, keeping only the MAX_TRACKED_USERS most recently used rows
+    
+    Returns the (user_id, thread_id) rows pruned to make room.
+    """
+    try:
+        with thread_db_lock:
+            db = get_thread_db()
+            db.execute("INSERT OR REPLACE INTO user_threads VALUES (?, ?, ?)", (user_id, thread_id, time.time()))
+            pruned = db.execute(
+                "SELECT user_id, thread_id FROM user_threads ORDER BY updated_at DESC LIMIT -1 OFFSET ?",
+                (MAX_TRACKED_USERS,)
+            ).fetchall()
+            db.executemany("DELETE FROM user_threads WHERE user_id = ?", [(row[0],) for row in pruned])
+            db.commit()
+        return pruned
+    except sqlite3.Error as e:
+        print(f"⚠️ Thread store write failed: {e}")
+        return []
 
-# Memory and duplicate prevention systems
-user_conversations = {}
+def touch_thread_id(user_id):
+    """Mark a user's stored thread as just used, so pruning keeps active users"""
+    try:
+        with thread_db_lock:
+            db = get_thread_db()
+            db.execute("UPDATE user_threads SET updated_at = ? WHERE user_id = ?", (time.time(), user_id))
+            db.commit()
+    except sqlite3.Error as e:
+        print(f"⚠️ Thread store touch failed: {e}")
+
+def forget_thread_id(user_id):
+    """Remove a user's stored thread id"""
+    try:
+        with thread_db_lock:
+            db = get_thread_db()
+            db.execute("DELETE FROM user_threads WHERE user_id = ?", (user_id,))
+            db.commit()
+    except sqlite3.Error as e:
+        print(f"⚠️ Thread store delete failed: {e}")
+
+async def delete_openai_thread(thread_id):
+    """Best-effort delete of a thread we no longer track"""
+    try:
+        await client.beta.threads.delete(thread_id)
+    except Exception as e:
+        print(f"⚠️ Could not delete evicted thread {thread_id}: {e}")
+
+async def store_thread_id(user_id, thread_id):
+    """Persist a new thread id, deleting the remote threads of rows pruned to make room"""
+    pruned = await asyncio.to_thread(save_thread_id, user_id, thread_id)
+    for pruned_user_id, pruned_thread_id in pruned:
+        await release_thread(pruned_user_id, pruned_thread_id)
+
+async def release_thread(user_id, thread_id):
+    """Forget and delete a user's thread once no run of theirs is using it"""
+    # Waits out an in-flight run - the user's lock is held for the whole request
+    async with get_user_lock(user_id):
+        # Still (or again) tracked in memory - its own eviction will release it later
+        if user_id in user_conversations and user_conversations[user_id]['thread_id'] == thread_id:
+            return
+        await asyncio.to_thread(forget_thread_id, user_id)
+        await delete_openai_thread(thread_id)
+
+def release_evicted_conversation(user_id, conversation):
+    """Drop the stored and remote OpenAI thread of a user pushed out of the LRU"""
+    run_in_background(release_thread(user_id, conversation['thread_id']))
+
+# Memory and duplicate prevention systems (per-user state is bounded so it can't grow forever)
+MAX_TRACKED_USERS = 10_000
+user_conversations = LRUDict(MAX_TRACKED_USERS, on_evict=release_evicted_conversation)
 processing_messages = set()
-last_response_time = {}
+last_response_time = LRUDict(MAX_TRACKED_USERS)
 
 print(f"💼 Starting {ASSISTANT_NAME} - {ASSISTANT_ROLE}...")
 
@@ -269,24 +481,64 @@ print(f"💼 Starting {ASSISTANT_NAME} - {ASSISTANT_ROLE}...")
 # EMAIL AND CALENDAR FUNCTIONS (Vivian's Specialty)
 # ============================================================================
 
+# Lets a briefing run its Gmail and Calendar fetches side by side
+google_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='vivian-google')
+
+# Google API statuses worth retrying (rate limits and transient server errors)
+RETRYABLE_HTTP_STATUSES = (429, 500, 502, 503, 504)
+
+def is_retryable_http_error(error):
+    """Check if a Google API error is a transient rate limit or server error"""
+    status = error.resp.status
+    if status in RETRYABLE_HTTP_STATUSES:
+        return True
+    # Gmail reports per-user rate limits as 403 rateLimitExceeded
+    return status == 403 and b'ratelimitexceeded' in (error.content or b'').lower()
+
+# httplib2 connections are not thread-safe, and function calls run on executor
+# threads, so requests sharing a service's http object take turns
+google_http_locks = weakref.WeakKeyDictionary()
+google_http_locks_guard = threading.Lock()
+
+def get_http_lock(http):
+    """Get the lock serializing requests over one Google service connection"""
+    with google_http_locks_guard:
+        lock = google_http_locks.get(http)
+        if lock is None:
+            lock = google_http_locks[http] = threading.Lock()
+        return lock
+
+def execute_with_retry(request, max_tries=5):
+    """Execute a Google API request with jittered exponential backoff on transient errors"""
+    for attempt in range(max_tries):
+        try:
+            with get_http_lock(request.http):
+                return request.execute()
+        except HttpError as e:
+            if attempt < max_tries - 1 and is_retryable_http_error(e):
+                delay = (2 ** attempt) * 0.5 + random.random() * 0.25
+                print(f"⏳ Google API HTTP {e.resp.status} - retrying in {delay:.1f}s...")
+                time.sleep(delay)
+                continue
+            raise
+
 def get_priority_emails(max_emails=5):
     """Get priority emails for briefing - unread, important, recent"""
     if not gmail_service:
         return "📧 **Priority Emails:** Gmail integration not available"
     
     try:
-        # Search for unread emails from today
+        # Search for emails from today
         import datetime
         today = datetime.datetime.now().strftime('%Y/%m/%d')
         
-        # Query for recent unread emails
-        query = f'is:unread after:{today}'
-        
-        messages_result = gmail_service.users().messages().list(
+        # Let Gmail filter unread server-side instead of fetching and discarding
+        messages_result = execute_with_retry(gmail_service.users().messages().list(
             userId='me',
-            q=query,
-            maxResults=max_emails
-        ).execute()
+            q=f'is:unread after:{today}',
+            maxResults=max_emails,
+            fields='messages/id'  # Only ids are needed before the per-message get
+        ))
         
         messages = messages_result.get('messages', [])
         
@@ -296,12 +548,17 @@ def get_priority_emails(max_emails=5):
         email_summaries = []
         for msg in messages[:max_emails]:
             try:
-                message = gmail_service.users().messages().get(
+                message = execute_with_retry(gmail_service.users().messages().get(
                     userId='me',
                     id=msg['id'],
                     format='metadata',
-                    metadataHeaders=['From', 'Subject', 'Date']
-                ).execute()
+                    metadataHeaders=['From', 'Subject'],
+                    fields='labelIds,payload/headers'
+                ))
+                
+                # Skip messages that were read between the list and get calls
+                if 'UNREAD' not in message.get('labelIds', []):
+                    continue
                 
                 headers = message['payload'].get('headers', [])
                 subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
@@ -338,15 +595,16 @@ def get_email_metrics():
     
     try:
         # Get inbox info
-        profile = gmail_service.users().getProfile(userId='me').execute()
+        profile = execute_with_retry(gmail_service.users().getProfile(userId='me', fields='messagesTotal'))
         total_messages = profile.get('messagesTotal', 0)
         
-        # Get unread count
-        unread_result = gmail_service.users().messages().list(
+        # Get unread count (only the estimate is needed, not the message ids)
+        unread_result = execute_with_retry(gmail_service.users().messages().list(
             userId='me',
             q='is:unread',
-            maxResults=1
-        ).execute()
+            maxResults=1,
+            fields='resultSizeEstimate'
+        ))
         unread_count = unread_result.get('resultSizeEstimate', 0)
         
         return f"📊 **Email Status:** {unread_count} unread of {total_messages} total messages"
@@ -359,6 +617,68 @@ def get_email_metrics():
 # WORK CALENDAR FUNCTIONS (Vivian's Specialty)
 # ============================================================================
 
+# Recently fetched event windows. Briefings and function calls ask for
+# overlapping ranges (today, tomorrow, next N days) within seconds of each
+# other, so narrower requests are sliced from a cached window
+CALENDAR_CACHE_TTL = 60  # seconds
+CALENDAR_CACHE_SIZE = 4
+calendar_event_cache = []  # (fetched_at, calendar_id, start_time, end_time, events)
+calendar_event_cache_lock = threading.Lock()
+
+def get_event_bounds(event):
+    """Get an event's start and end as aware datetimes (all-day dates at local midnight)"""
+    bounds = []
+    for key in ('start', 'end'):
+        value = event.get(key, event['start'])
+        if 'dateTime' in value:
+            bounds.append(datetime.fromisoformat(value['dateTime'].replace('Z', '+00:00')))
+        else:
+            bounds.append(TORONTO_TZ.localize(datetime.fromisoformat(value['date'])))
+    return bounds
+
+def normalize_event(event):
+    """Parse a fetched event's times once, so handlers and the cache don't re-parse them"""
+    try:
+        event['local_start'] = parse_event_start(event, TORONTO_TZ)
+        event['local_bounds'] = get_event_bounds(event)
+        return True
+    except Exception as e:
+        # Leave it unparsed - formatting falls back to its own error handling
+        print(f"❌ Error parsing event times: {e}")
+        return False
+
+def get_cached_calendar_events(calendar_id, start_time, end_time, max_results):
+    """Serve a time range from a fresh cached window that covers it, or None"""
+    now = time.monotonic()
+    with calendar_event_cache_lock:
+        entries = list(calendar_event_cache)
+    
+    for fetched_at, cached_id, cached_start, cached_end, events in reversed(entries):
+        if cached_id != calendar_id or now - fetched_at > CALENDAR_CACHE_TTL:
+            continue
+        if cached_start <= start_time and end_time <= cached_end:
+            # Same overlap rule as the API's timeMin/timeMax
+            matching = []
+            for event in events:
+                event_start, event_end = event['local_bounds']
+                if event_end > start_time and event_start < end_time:
+                    matching.append(event)
+            return matching[:max_results]
+    return None
+
+def cache_calendar_events(calendar_id, start_time, end_time, events):
+    """Remember a fetched window, dropping the oldest beyond CALENDAR_CACHE_SIZE"""
+    with calendar_event_cache_lock:
+        calendar_event_cache.append((time.monotonic(), calendar_id, start_time, end_time, events))
+        del calendar_event_cache[:-CALENDAR_CACHE_SIZE]
+
+# Last ETag and body per events.list query (day windows repeat all day), for conditional requests
+calendar_etag_cache = LRUDict(64)
+calendar_etag_cache_lock = threading.Lock()  # Read and written from google_executor threads
+
+# Only the parts of an event the bot reads - skips attendees, reminders, links etc. in the response
+CALENDAR_EVENT_FIELDS = 'etag,nextPageToken,items(summary,description,location,start,end)'
+
 def get_work_calendar_events(start_time, end_time, max_results=100):
     """Get work calendar events with enhanced error handling"""
     if not calendar_service or not accessible_calendars:
@@ -368,56 +688,121 @@ def get_work_calendar_events(start_time, end_time, max_results=100):
         # Use the work calendar ID from accessible_calendars
         calendar_name, calendar_id = accessible_calendars[0]  # Only one work calendar
         
-        events_result = calendar_service.events().list(
-            calendarId=calendar_id,
-            timeMin=start_time.isoformat(),
-            timeMax=end_time.isoformat(),
-            maxResults=max_results,
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
+        cached_events = get_cached_calendar_events(calendar_id, start_time, end_time, max_results)
+        if cached_events is not None:
+            return cached_events
+        
+        list_params = {
+            'calendarId': calendar_id,
+            'timeMin': start_time.isoformat(),
+            'timeMax': end_time.isoformat(),
+            'singleEvents': True,
+            'orderBy': 'startTime',
+            'fields': CALENDAR_EVENT_FIELDS
+        }
+        request = calendar_service.events().list(maxResults=max_results, **list_params)
+        
+        # Ask Google to skip the body if this exact query hasn't changed since last time
+        with calendar_etag_cache_lock:
+            previous = calendar_etag_cache.get(request.uri)
+        if previous:
+            request.headers['If-None-Match'] = previous[0]
+        
+        try:
+            events_result = execute_with_retry(request)
+        except HttpError as e:
+            if not previous or e.resp.status != 304:
+                raise
+            events_result = previous[1]
+        else:
+            # Only a single-page listing is remembered: a 304 vouches for the first page,
+            # and an old page token must never be replayed into a fresh paging sequence
+            if events_result.get('etag') and not events_result.get('nextPageToken'):
+                with calendar_etag_cache_lock:
+                    calendar_etag_cache[request.uri] = (events_result['etag'], events_result)
         
         events = events_result.get('items', [])
+        
+        # Google may return a short page even when more events match - follow the token up to max_results
+        page_token = events_result.get('nextPageToken')
+        while page_token and len(events) < max_results:
+            page = execute_with_retry(calendar_service.events().list(
+                maxResults=max_results - len(events), pageToken=page_token, **list_params
+            ))
+            events = events + page.get('items', [])
+            page_token = page.get('nextPageToken')
+        
+        all_normalized = all([normalize_event(event) for event in events])
+        
+        # A window cut off at max_results, or with events we can't place in time,
+        # can't answer narrower queries
+        if all_normalized and len(events) < max_results:
+            cache_calendar_events(calendar_id, start_time, end_time, events)
         return events
         
     except Exception as e:
         print(f"❌ Error getting work events: {e}")
         return []
 
-def format_work_event(event, user_timezone=None):
-    """Format a work calendar event with PR context"""
+def get_local_day_bounds(day):
+    """UTC start and end of a Toronto calendar day (midnight to midnight, DST-aware)"""
+    start = TORONTO_TZ.localize(datetime.combine(day, datetime.min.time()))
+    end = TORONTO_TZ.localize(datetime.combine(day + timedelta(days=1), datetime.min.time()))
+    return start.astimezone(pytz.UTC), end.astimezone(pytz.UTC)
+
+def get_title_words(title):
+    """Split an event title into a set of lowercase words for keyword matching"""
+    return set(WORD_RE.findall(title.lower()))
+
+def parse_event_start(event, user_timezone):
+    """Parse a calendar event's start into a local datetime and an all-day flag"""
+    if user_timezone is TORONTO_TZ and 'local_start' in event:
+        return event['local_start']
+    start = event['start']
+    if 'dateTime' in start:
+        start_time = datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00'))
+        return start_time.astimezone(user_timezone), False
+    # All-day events only carry a date - anchor them to local midnight
+    return user_timezone.localize(datetime.fromisoformat(start['date'])), True
+
+@functools.lru_cache(maxsize=512)
+def format_event_time(start_time):
+    """Format an event start as e.g. '09:30 AM' (the same events get re-formatted within a run)"""
+    return start_time.strftime('%I:%M %p')
+
+def format_work_event(event, user_timezone=None, start=None):
+    """Format a work calendar event with PR context (start: parse_event_start result, if already known)"""
     if user_timezone is None:
-        user_timezone = pytz.timezone('America/Toronto')
+        user_timezone = TORONTO_TZ
     
-    start = event['start'].get('dateTime', event['start'].get('date'))
     title = event.get('summary', 'Untitled Meeting')
     location = event.get('location', '')
     description = event.get('description', '')
     
     # Add work context with PR intelligence
-    if any(keyword in title.lower() for keyword in ['meeting', 'call', 'sync', 'standup', 'review']):
+    title_words = get_title_words(title)
+    if title_words & MEETING_KEYWORDS:
         title = f"💼 {title}"
-    elif any(keyword in title.lower() for keyword in ['interview', 'media', 'press', 'pr']):
+    elif title_words & MEDIA_KEYWORDS:
         title = f"📺 {title}"
-    elif any(keyword in title.lower() for keyword in ['presentation', 'demo', 'launch']):
+    elif title_words & HIGH_VISIBILITY_KEYWORDS:
         title = f"🎯 {title}"
     else:
         title = f"📅 {title}"
     
-    if 'T' in start:  # Has time
-        try:
-            utc_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
-            local_time = utc_time.astimezone(user_timezone)
-            time_str = local_time.strftime('%I:%M %p')
-            
-            location_str = f" ({location})" if location else ""
-            return f"• {time_str}: {title}{location_str}"
-        except Exception as e:
-            print(f"❌ Error formatting work event: {e}")
-            return f"• {title}"
-    else:  # All day event
-        location_str = f" ({location})" if location else ""
+    location_str = f" ({location})" if location else ""
+    
+    try:
+        start_time, is_all_day = start or parse_event_start(event, user_timezone)
+    except Exception as e:
+        print(f"❌ Error formatting work event: {e}")
+        return f"• {title}"
+    
+    if is_all_day:
         return f"• All Day: {title}{location_str}"
+    
+    time_str = format_event_time(start_time)
+    return f"• {time_str}: {title}{location_str}"
 
 def get_work_schedule_today():
     """Get today's work schedule"""
@@ -425,13 +810,10 @@ def get_work_schedule_today():
         return f"📅 **Today's Work Schedule:** {CALENDAR_UNAVAILABLE_MSG}"
     
     try:
-        toronto_tz = pytz.timezone('America/Toronto')
-        
-        today_toronto = datetime.now(toronto_tz).replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow_toronto = today_toronto.replace(hour=23, minute=59, second=59)
+        toronto_tz = TORONTO_TZ
+        now = datetime.now(toronto_tz)
         
-        today_utc = today_toronto.astimezone(pytz.UTC)
-        tomorrow_utc = tomorrow_toronto.astimezone(pytz.UTC)
+        today_utc, tomorrow_utc = get_local_day_bounds(now.date())
         
         # Get events from work calendar only
         events = get_work_calendar_events(today_utc, tomorrow_utc)
@@ -439,30 +821,23 @@ def get_work_schedule_today():
         if not events:
             return "💼 **Today's Work Schedule:** No work meetings scheduled"
         
-        # Format events
-        formatted_events = []
-        for event in events:
-            formatted = format_work_event(event, toronto_tz)
-            formatted_events.append(formatted)
-        
-        # Sort by time
-        def get_event_time(event):
-            start = event['start'].get('dateTime', event['start'].get('date'))
+        # Parse each start once - it is both the sort key and the displayed time
+        def parse_start(event):
             try:
-                if 'T' in start:
-                    utc_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    return utc_time.astimezone(toronto_tz)
-                else:
-                    return datetime.fromisoformat(start)
-            except:
-                return datetime.now(toronto_tz)
-        
-        events.sort(key=get_event_time)
-        formatted_events = [format_work_event(event, toronto_tz) for event in events]
-        
+                return parse_event_start(event, toronto_tz)
+            except Exception:
+                return None
+        
+        # Sort by time into a new list, leaving the fetched events untouched
+        timed_events = sorted(
+            ((parse_start(event), event) for event in events),
+            key=lambda item: item[0][0] if item[0] else now
+        )
         header = f"💼 **Today's Work Schedule:** {len(events)} meetings/events"
         
-        return header + "\n\n" + "\n".join(formatted_events[:15])
+        return header + "\n\n" + "\n".join(
+            format_work_event(event, toronto_tz, start) for start, event in timed_events[:15]
+        )
         
     except Exception as e:
         print(f"❌ Work calendar error: {e}")
@@ -474,7 +849,7 @@ def get_work_upcoming_events(days=7):
         return f"💼 **Upcoming Work Events ({days} days):** {CALENDAR_UNAVAILABLE_MSG}"
     
     try:
-        toronto_tz = pytz.timezone('America/Toronto')
+        toronto_tz = TORONTO_TZ
         
         start_toronto = datetime.now(toronto_tz)
         end_toronto = start_toronto + timedelta(days=days)
@@ -490,21 +865,11 @@ def get_work_upcoming_events(days=7):
         
         events_by_date = defaultdict(list)
         
+        # Group by calendar date; labels and event lines are only formatted for what is shown
         for event in events:
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            
             try:
-                if 'T' in start:
-                    utc_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    toronto_time = utc_time.astimezone(toronto_tz)
-                    date_str = toronto_time.strftime('%a %m/%d')
-                    formatted = format_work_event(event, toronto_tz)
-                    events_by_date[date_str].append(formatted)
-                else:
-                    date_obj = datetime.fromisoformat(start)
-                    date_str = date_obj.strftime('%a %m/%d')
-                    formatted = format_work_event(event, toronto_tz)
-                    events_by_date[date_str].append(formatted)
+                start = parse_event_start(event, toronto_tz)
+                events_by_date[start[0].date()].append((start, event))
             except Exception as e:
                 print(f"❌ Date parsing error: {e}")
                 continue
@@ -513,8 +878,8 @@ def get_work_upcoming_events(days=7):
         total_events = len(events)
         
         for date, day_events in list(events_by_date.items())[:7]:
-            formatted.append(f"**{date}**")
-            formatted.extend(day_events[:6])
+            formatted.append(f"**{date.strftime('%a %m/%d')}**")
+            formatted.extend(format_work_event(event, toronto_tz, start) for start, event in day_events[:6])
         
         header = f"📅 **Upcoming Work Events ({days} days):** {total_events} total"
         
@@ -524,12 +889,22 @@ def get_work_upcoming_events(days=7):
         print(f"❌ Work calendar error: {e}")
         return f"📅 **Upcoming Work Events ({days} days):** Error retrieving work calendar data"
 
+def format_weekend_event(event, user_timezone):
+    """Format an event without work context for weekend briefings"""
+    title = event.get('summary', 'Untitled Event')
+    start_time, is_all_day = parse_event_start(event, user_timezone)
+    
+    if is_all_day:
+        return f"• All Day: 🌿 {title}"
+    return f"• {format_event_time(start_time)}: 🌿 {title}"
+
 def get_work_morning_briefing():
     """Work-focused morning briefing with PR intelligence - includes weekend mode"""
-    toronto_tz = pytz.timezone('America/Toronto')
-    current_day = datetime.now(toronto_tz).weekday()
+    toronto_tz = TORONTO_TZ
+    now = datetime.now(toronto_tz)
+    current_day = now.weekday()
     is_weekend = current_day >= 5  # Saturday=5, Sunday=6
-    current_time = datetime.now(toronto_tz).strftime('%A, %B %d')
+    current_time = now.strftime('%A, %B %d')
     
     # Weekend mode - focus on personal time instead of work
     if is_weekend:
@@ -538,31 +913,16 @@ def get_work_morning_briefing():
         
         try:
             # Get any weekend events (might be personal)
-            today_toronto = datetime.now(toronto_tz).replace(hour=0, minute=0, second=0, microsecond=0)
-            tomorrow_toronto = today_toronto.replace(hour=23, minute=59, second=59)
+            today_utc, tomorrow_utc = get_local_day_bounds(now.date())
             
-            today_utc = today_toronto.astimezone(pytz.UTC)
-            tomorrow_utc = tomorrow_toronto.astimezone(pytz.UTC)
-            
-            weekend_events = get_work_calendar_events(today_utc, tomorrow_utc)
+            # Only the first three are shown - let the API stop there
+            weekend_events = get_work_calendar_events(today_utc, tomorrow_utc, max_results=3)
             
             weekend_schedule = ""
             if weekend_events:
-                formatted_events = []
-                for event in weekend_events[:3]:
-                    # Format without work context for weekends
-                    title = event.get('summary', 'Untitled Event')
-                    start = event['start'].get('dateTime', event['start'].get('date'))
-                    
-                    if 'T' in start:
-                        utc_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                        local_time = utc_time.astimezone(toronto_tz)
-                        time_str = local_time.strftime('%I:%M %p')
-                        formatted_events.append(f"• {time_str}: 🌿 {title}")
-                    else:
-                        formatted_events.append(f"• All Day: 🌿 {title}")
-                
-                weekend_schedule = "📅 **Today's Personal Schedule:**\n" + "\n".join(formatted_events)
+                weekend_schedule = "📅 **Today's Personal Schedule:**\n" + "\n".join(
+                    format_weekend_event(event, toronto_tz) for event in weekend_events[:3]
+                )
             else:
                 weekend_schedule = "📅 **Today's Personal Schedule:** No events scheduled - perfect for relaxation!"
             
@@ -587,31 +947,26 @@ def get_work_morning_briefing():
         return f"🌅 **Work Morning Briefing:** {CALENDAR_UNAVAILABLE_MSG}"
     
     try:
+        # Gmail and Calendar use separate connections - fetch the email half alongside
+        email_future = google_executor.submit(lambda: (get_email_metrics(), get_priority_emails(3)))
+        
         today_schedule = get_work_schedule_today()
         
         # Get tomorrow's work events
-        today_toronto = datetime.now(toronto_tz).replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow_toronto = today_toronto + timedelta(days=1)
-        day_after_toronto = tomorrow_toronto + timedelta(days=1)
-        
-        tomorrow_utc = tomorrow_toronto.astimezone(pytz.UTC)
-        day_after_utc = day_after_toronto.astimezone(pytz.UTC)
+        tomorrow_utc, day_after_utc = get_local_day_bounds(now.date() + timedelta(days=1))
         
-        # Get tomorrow's work events from work calendar only
-        tomorrow_events = get_work_calendar_events(tomorrow_utc, day_after_utc)
+        # Get tomorrow's work events from work calendar only (the preview shows four)
+        tomorrow_events = get_work_calendar_events(tomorrow_utc, day_after_utc, max_results=4)
         
         if tomorrow_events:
-            tomorrow_formatted = []
-            for event in tomorrow_events[:4]:
-                formatted = format_work_event(event, toronto_tz)
-                tomorrow_formatted.append(formatted)
-            tomorrow_preview = "💼 **Tomorrow's Work Preview:**\n" + "\n".join(tomorrow_formatted)
+            tomorrow_preview = "💼 **Tomorrow's Work Preview:**\n" + "\n".join(
+                format_work_event(event, toronto_tz) for event in tomorrow_events[:4]
+            )
         else:
             tomorrow_preview = "💼 **Tomorrow's Work Preview:** Clear schedule"
         
         # Get email context for briefing
-        email_metrics = get_email_metrics()
-        priority_emails = get_priority_emails(3)
+        email_metrics, priority_emails = email_future.result()
         
         briefing = f"🌅 **Good Morning! Work Briefing for {current_time}**\n\n{today_schedule}\n\n{tomorrow_preview}\n\n{email_metrics}\n\n{priority_emails}"
         
@@ -632,7 +987,7 @@ def export_work_data_for_rose():
         }
     
     try:
-        toronto_tz = pytz.timezone('America/Toronto')
+        toronto_tz = TORONTO_TZ
         now = datetime.now(toronto_tz)
         
         # Get next 7 days of work events for Rose
@@ -645,17 +1000,15 @@ def export_work_data_for_rose():
         pr_insights = []
         
         for event in events:
-            start = event['start'].get('dateTime', event['start'].get('date'))
+            start_time, is_all_day = parse_event_start(event, toronto_tz)
             title = event.get('summary', 'Untitled Meeting')
             location = event.get('location', '')
             description = event.get('description', '')
             
             # Format for Rose consumption
-            if 'T' in start:
-                utc_time = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                toronto_time = utc_time.astimezone(toronto_tz)
-                date_str = toronto_time.strftime('%A, %B %d')
-                time_str = toronto_time.strftime('%I:%M %p')
+            if not is_all_day:
+                date_str = start_time.strftime('%A, %B %d')
+                time_str = format_event_time(start_time)
                 
                 formatted_events.append({
                     'date': date_str,
@@ -667,14 +1020,15 @@ def export_work_data_for_rose():
                 })
                 
                 # Generate PR insights
-                if any(keyword in title.lower() for keyword in ['interview', 'media', 'press', 'pr']):
+                title_words = get_title_words(title)
+                if title_words & MEDIA_KEYWORDS:
                     pr_insights.append({
                         'date': date_str,
                         'time': time_str,
                         'insight': f"Media/PR event: {title}",
                         'preparation': 'Prepare talking points, media kit, and follow-up materials'
                     })
-                elif any(keyword in title.lower() for keyword in ['presentation', 'demo', 'launch']):
+                elif title_words & HIGH_VISIBILITY_KEYWORDS:
                     pr_insights.append({
                         'date': date_str,
                         'time': time_str,
@@ -704,60 +1058,151 @@ def export_work_data_for_rose():
 # PR & COMMUNICATIONS RESEARCH FUNCTIONS
 # ============================================================================
 
+# One pooled session for Brave and webhook calls, so connections (and their
+# TLS handshakes) are reused across requests. Created lazily inside the event loop
+http_session = None
+
+def get_http_session():
+    """Get the shared aiohttp session, creating it on first use"""
+    global http_session
+    if http_session is None or http_session.closed:
+        http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+    return http_session
+
+async def close_http_session():
+    """Close the shared aiohttp session on shutdown"""
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+
+# Repeat searches are answered from memory: research holds for an hour,
+# news for five minutes so monitoring stays fresh
+RESEARCH_CACHE_TTL = {'pr': 3600, 'news': 300}
+research_cache = LRUDict(512)  # (search_type, query key, count) -> (expires_at, (results_text, sources))
+
+def research_query_key(query):
+    """Normalize a query for caching so case, punctuation and word order changes still hit"""
+    return ' '.join(sorted(set(WORD_RE.findall(query.lower()))))
+
+def get_cached_research(key):
+    """Get a cached (results_text, sources) pair if it hasn't expired"""
+    if key not in research_cache:
+        return None
+    expires_at, result = research_cache[key]
+    if time.monotonic() >= expires_at:
+        del research_cache[key]
+        return None
+    logger.debug("🔍 Research cache hit: %.50s", key[1])
+    return result
+
+def cache_research(key, result):
+    """Cache a successful search result with its search type's TTL"""
+    research_cache[key] = (time.monotonic() + RESEARCH_CACHE_TTL[key[0]], result)
+    return result
+
+BRAVE_SEARCH_URL = 'https://api.search.brave.com/res/v1/web/search'
+# Built once - aiohttp adds Accept-Encoding itself and inflates gzip responses as they stream in
+BRAVE_HEADERS = {
+    'X-Subscription-Token': BRAVE_API_KEY or '',
+    'Accept': 'application/json'
+}
+
+BRAVE_BASE_PARAMS = {
+    'country': 'US',
+    'search_lang': 'en',
+    'ui_lang': 'en',
+    'safesearch': 'moderate',
+    'result_filter': 'web'  # Only web results are read - skip news/video/discussion blocks
+}
+
+# Search type -> (words appended to the query, extra Brave params)
+BRAVE_SEARCH_TYPES = {
+    'pr': (" communications PR strategy media relations 2025", {}),
+    'news': (" news recent 2025", {'freshness': 'pd'}),  # Past day for fresh news
+}
+
+def build_brave_params(search_type, query, num_results):
+    """Build Brave search params for a search type in one pass"""
+    suffix, extra_params = BRAVE_SEARCH_TYPES[search_type]
+    return {**BRAVE_BASE_PARAMS, **extra_params, 'q': f"{query}{suffix}", 'count': num_results}
+
+BRAVE_MAX_TRIES = 3
+
+async def fetch_brave_results(params):
+    """Run a Brave web search with jittered exponential backoff on transient failures
+    
+    Returns the final HTTP status and the web results (empty unless the status is 200).
+    """
+    session = get_http_session()
+    for attempt in range(BRAVE_MAX_TRIES):
+        last_try = attempt == BRAVE_MAX_TRIES - 1
+        try:
+            async with session.get(BRAVE_SEARCH_URL, headers=BRAVE_HEADERS,
+                                   params=params, timeout=10) as response:
+                if response.status == 200:
+                    data = json_loads(await response.read())
+                    return 200, data.get('web', {}).get('results', [])
+                if last_try or response.status not in RETRYABLE_HTTP_STATUSES:
+                    return response.status, []
+                reason = f"HTTP {response.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if last_try:
+                raise
+            reason = type(e).__name__
+        
+        delay = min(0.25 * 2 ** attempt, 2.0) + random.random() * 0.25
+        print(f"⏳ Brave search {reason} - retrying in {delay:.1f}s...")
+        await asyncio.sleep(delay)
+
+# Host part of a result URL, e.g. 'www.example.com' from 'https://www.example.com/page'
+SOURCE_DOMAIN_RE = re.compile(r'//([^/?#]+)')
+
+def format_search_results(results, num_results):
+    """Format Brave web results as numbered snippets plus a source list"""
+    formatted_results = []
+    sources = []
+    
+    for i, result in enumerate(results[:num_results], 1):
+        title = result.get('title', 'No title')
+        snippet = result.get('description', 'No description')
+        url = result.get('url', '')
+        
+        domain_match = SOURCE_DOMAIN_RE.search(url)
+        domain = domain_match.group(1) if domain_match else 'Unknown'
+        
+        formatted_results.append(f"**{i}. {title}**\n{snippet}")
+        sources.append({
+            'number': i,
+            'title': title,
+            'url': url,
+            'domain': domain
+        })
+    
+    return "\n\n".join(formatted_results), sources
+
 async def pr_research_enhanced(query, focus_area="pr", num_results=3):
     """Enhanced PR and communications research with comprehensive error handling"""
     if not BRAVE_API_KEY:
         return "🔍 PR research requires Brave Search API configuration", []
     
     try:
-        pr_query = f"{query} {focus_area} communications PR strategy media relations 2025"
+        params = build_brave_params('pr', f"{query} {focus_area}", num_results)
+        cache_key = ('pr', research_query_key(params['q']), num_results)
+        cached = get_cached_research(cache_key)
+        if cached:
+            return cached
         
-        headers = {
-            'X-Subscription-Token': BRAVE_API_KEY,
-            'Accept': 'application/json'
-        }
+        status, results = await fetch_brave_results(params)
+        if status != 200:
+            return f"🔍 PR search error: HTTP {status}", []
         
-        params = {
-            'q': pr_query,
-            'count': num_results,
-            'country': 'US',
-            'search_lang': 'en',
-            'ui_lang': 'en',
-            'safesearch': 'moderate'
-        }
+        if not results:
+            return "🔍 No PR research results found for this query", []
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://api.search.brave.com/res/v1/web/search', 
-                                   headers=headers, params=params, timeout=10) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    results = data.get('web', {}).get('results', [])
-                    
-                    if not results:
-                        return "🔍 No PR research results found for this query", []
-                    
-                    formatted_results = []
-                    sources = []
-                    
-                    for i, result in enumerate(results[:num_results]):
-                        title = result.get('title', 'No title')
-                        snippet = result.get('description', 'No description')
-                        url = result.get('url', '')
-                        
-                        domain = url.split('/')[2] if len(url.split('/')) > 2 else 'Unknown'
-                        
-                        formatted_results.append(f"**{i+1}. {title}**\n{snippet}")
-                        sources.append({
-                            'number': i+1,
-                            'title': title,
-                            'url': url,
-                            'domain': domain
-                        })
-                    
-                    return "\n\n".join(formatted_results), sources
-                else:
-                    return f"🔍 PR search error: HTTP {response.status}", []
-                    
+        return cache_research(cache_key, format_search_results(results, num_results))
+                
     except asyncio.TimeoutError:
         return "🔍 PR search timed out", []
     except Exception as e:
@@ -770,55 +1215,21 @@ async def news_monitoring_search(query, num_results=5):
         return "📰 News monitoring requires Brave Search API configuration", []
     
     try:
-        news_query = f"{query} news recent 2025"
+        params = build_brave_params('news', query, num_results)
+        cache_key = ('news', research_query_key(params['q']), num_results)
+        cached = get_cached_research(cache_key)
+        if cached:
+            return cached
         
-        headers = {
-            'X-Subscription-Token': BRAVE_API_KEY,
-            'Accept': 'application/json'
-        }
+        status, results = await fetch_brave_results(params)
+        if status != 200:
+            return f"📰 News search error: HTTP {status}", []
         
-        params = {
-            'q': news_query,
-            'count': num_results,
-            'country': 'US',
-            'search_lang': 'en',
-            'ui_lang': 'en',
-            'safesearch': 'moderate',
-            'freshness': 'pd'  # Past day for fresh news
-        }
+        if not results:
+            return "📰 No recent news found for this query", []
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://api.search.brave.com/res/v1/web/search', 
-                                   headers=headers, params=params, timeout=10) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    results = data.get('web', {}).get('results', [])
-                    
-                    if not results:
-                        return "📰 No recent news found for this query", []
-                    
-                    formatted_results = []
-                    sources = []
-                    
-                    for i, result in enumerate(results[:num_results]):
-                        title = result.get('title', 'No title')
-                        snippet = result.get('description', 'No description')
-                        url = result.get('url', '')
-                        
-                        domain = url.split('/')[2] if len(url.split('/')) > 2 else 'Unknown'
-                        
-                        formatted_results.append(f"**{i+1}. {title}**\n{snippet}")
-                        sources.append({
-                            'number': i+1,
-                            'title': title,
-                            'url': url,
-                            'domain': domain
-                        })
-                    
-                    return "\n\n".join(formatted_results), sources
-                else:
-                    return f"📰 News search error: HTTP {response.status}", []
-                    
+        return cache_research(cache_key, format_search_results(results, num_results))
+                
     except asyncio.TimeoutError:
         return "📰 News search timed out", []
     except Exception as e:
@@ -829,275 +1240,405 @@ async def news_monitoring_search(query, num_results=5):
 # ENHANCED FUNCTION HANDLING
 # ============================================================================
 
-async def handle_vivian_functions_enhanced(run, thread_id):
-    """Enhanced function handling with work calendar and PR functions"""
+async def format_work_briefing_text(heading):
+    """Work briefing as text for the OpenAI Assistant (Discord commands use embeds)"""
+    # Sheets and Calendar are independent blocking calls - fetch them side by side
+    briefing_notes, calendar_summary = await asyncio.gather(
+        asyncio.to_thread(read_briefing_notes),
+        asyncio.to_thread(get_work_calendar_summary)
+    )
+    return f"**{heading}**\n\n{briefing_notes}\n\n---\n\n{calendar_summary}"
+
+async def run_work_briefing_function(arguments):
+    """Work briefing for the OpenAI Assistant"""
+    return await format_work_briefing_text(f"Work Briefing ({arguments.get('type', 'morning').title()})")
+
+async def run_work_review_function(arguments):
+    """End-of-day work review for the OpenAI Assistant"""
+    return await format_work_briefing_text("End-of-Day Work Review")
+
+def format_work_data_export():
+    """Summarize the Rose work data export for the OpenAI Assistant"""
+    export_data = export_work_data_for_rose()
+    if export_data['status'] != 'success':
+        return f"❌ **Export Failed:** {export_data['message']}"
+    
+    output = f"📊 **Work Data Export:** {export_data['message']}\n\n"
+    if export_data['work_events']:
+        output += "**Sample Work Events:**\n"
+        for event in export_data['work_events'][:3]:
+            output += f"• {event['date']} at {event['time']}: {event['title']}\n"
+    if export_data['pr_insights']:
+        output += "\n**PR Insights:**\n"
+        for insight in export_data['pr_insights'][:2]:
+            output += f"• {insight['insight']}\n"
+    output += f"\n🤝 **Rose Integration:** Data exported for executive briefing"
+    return output
+
+async def run_pr_research_function(arguments):
+    """PR research for the OpenAI Assistant, with numbered sources"""
+    query = arguments.get('query', '')
+    if not query:
+        return "🔍 No PR research query provided"
+    
+    focus = arguments.get('focus', 'pr')
+    num_results = arguments.get('num_results', 3)
+    search_results, sources = await pr_research_enhanced(query, focus, num_results)
+    output = f"💼 **PR Research:** {query}\n\n{search_results}"
+    
+    if sources:
+        output += "\n\n📚 **Sources:**\n"
+        for source in sources:
+            output += f"({source['number']}) {source['title']} - {source['domain']}\n"
+    return output
+
+async def run_news_monitoring_function(arguments):
+    """News monitoring for the OpenAI Assistant, with numbered sources"""
+    query = arguments.get('query', '')
+    if not query:
+        return "📰 No news monitoring query provided"
+    
+    num_results = arguments.get('num_results', 5)
+    search_results, sources = await news_monitoring_search(query, num_results)
+    output = f"📰 **News Monitoring:** {query}\n\n{search_results}"
+    
+    if sources:
+        output += "\n\n📚 **News Sources:**\n"
+        for source in sources:
+            output += f"({source['number']}) {source['title']} - {source['domain']}\n"
+    return output
+
+# Assistant function name -> handler taking the parsed arguments.
+# Coroutine handlers are awaited, plain ones are called directly.
+VIVIAN_FUNCTION_HANDLERS = {
+    # WORK CALENDAR FUNCTIONS
+    "get_work_schedule_today": lambda arguments: get_work_schedule_today(),
+    "get_work_upcoming_events": lambda arguments: get_work_upcoming_events(arguments.get('days', 7)),
+    "get_work_morning_briefing": lambda arguments: get_work_morning_briefing(),
+    "read_briefing_notes": lambda arguments: read_briefing_notes(),
+    "generate_work_briefing": run_work_briefing_function,
+    "generate_work_review": run_work_review_function,
+    "get_work_calendar_summary": lambda arguments: get_work_calendar_summary(),
+    "export_work_data_for_rose": lambda arguments: format_work_data_export(),
+    
+    # EMAIL FUNCTIONS
+    "get_priority_emails": lambda arguments: get_priority_emails(arguments.get('max_emails', 5)),
+    "get_email_metrics": lambda arguments: get_email_metrics(),
+    
+    # PR RESEARCH FUNCTIONS
+    "pr_research": run_pr_research_function,
+    "news_monitoring": run_news_monitoring_function,
+}
+
+# Caps tool calls in flight across all runs, so a burst of calls can't flood Brave or Google
+tool_call_semaphore = asyncio.Semaphore(8)
+
+async def handle_vivian_functions_enhanced(run):
+    """Run the tool calls a run is waiting on and return their outputs for submission"""
     
     if not run or not hasattr(run, 'required_action') or not run.required_action:
-        return
+        return []
         
     if not hasattr(run.required_action, 'submit_tool_outputs') or not run.required_action.submit_tool_outputs:
-        return
+        return []
     
     if not hasattr(run.required_action.submit_tool_outputs, 'tool_calls') or not run.required_action.submit_tool_outputs.tool_calls:
-        return
+        return []
     
-    tool_outputs = []
+    loop = asyncio.get_running_loop()
     
-    for tool_call in run.required_action.submit_tool_outputs.tool_calls:
+    async def run_tool_call(tool_call):
         function_name = getattr(tool_call.function, 'name', 'unknown')
         
         try:
             arguments_str = getattr(tool_call.function, 'arguments', '{}')
-            arguments = json.loads(arguments_str) if arguments_str else {}
+            arguments = json_loads(arguments_str) if arguments_str else {}
         except (json.JSONDecodeError, AttributeError) as e:
             print(f"❌ Error parsing function arguments: {e}")
             arguments = {}
         
         print(f"💼 Vivian Function: {function_name}")
-        print(f"📋 Arguments: {arguments}")
+        logger.debug("📋 Arguments: %s", arguments)
         
         try:
-            # WORK CALENDAR FUNCTIONS
-            if function_name == "get_work_schedule_today":
-                output = get_work_schedule_today()
-                
-            elif function_name == "get_work_upcoming_events":
-                days = arguments.get('days', 7)
-                output = get_work_upcoming_events(days)
-                
-            elif function_name == "get_work_morning_briefing":
-                output = get_work_morning_briefing()
-            
-            elif function_name == "read_briefing_notes":
-                output = read_briefing_notes()
-            
-            elif function_name == "generate_work_briefing":
-                briefing_type = arguments.get('type', 'morning')
-                # For OpenAI Assistant, return text format not embeds
-                briefing_notes = read_briefing_notes()
-                calendar_summary = get_work_calendar_summary()
-                output = f"**Work Briefing ({briefing_type.title()})**\n\n{briefing_notes}\n\n---\n\n{calendar_summary}"
-            
-            elif function_name == "generate_work_review":
-                # For OpenAI Assistant, return text format not embeds
-                briefing_notes = read_briefing_notes()
-                calendar_summary = get_work_calendar_summary()
-                output = f"**End-of-Day Work Review**\n\n{briefing_notes}\n\n---\n\n{calendar_summary}"
-            
-            elif function_name == "get_work_calendar_summary":
-                output = get_work_calendar_summary()
-                
-            elif function_name == "export_work_data_for_rose":
-                export_data = export_work_data_for_rose()
-                if export_data['status'] == 'success':
-                    output = f"📊 **Work Data Export:** {export_data['message']}\n\n"
-                    if export_data['work_events']:
-                        output += "**Sample Work Events:**\n"
-                        for event in export_data['work_events'][:3]:
-                            output += f"• {event['date']} at {event['time']}: {event['title']}\n"
-                    if export_data['pr_insights']:
-                        output += "\n**PR Insights:**\n"
-                        for insight in export_data['pr_insights'][:2]:
-                            output += f"• {insight['insight']}\n"
-                    output += f"\n🤝 **Rose Integration:** Data exported for executive briefing"
-                else:
-                    output = f"❌ **Export Failed:** {export_data['message']}"
-                    
-            # EMAIL FUNCTIONS
-            elif function_name == "get_priority_emails":
-                max_emails = arguments.get('max_emails', 5)
-                output = get_priority_emails(max_emails)
-                
-            elif function_name == "get_email_metrics":
-                output = get_email_metrics()
-            
-            # PR RESEARCH FUNCTIONS
-            elif function_name == "pr_research":
-                query = arguments.get('query', '')
-                focus = arguments.get('focus', 'pr')
-                num_results = arguments.get('num_results', 3)
-                
-                if query:
-                    search_results, sources = await pr_research_enhanced(query, focus, num_results)
-                    output = f"💼 **PR Research:** {query}\n\n{search_results}"
-                    
-                    if sources:
-                        output += "\n\n📚 **Sources:**\n"
-                        for source in sources:
-                            output += f"({source['number']}) {source['title']} - {source['domain']}\n"
-                else:
-                    output = "🔍 No PR research query provided"
-                    
-            elif function_name == "news_monitoring":
-                query = arguments.get('query', '')
-                num_results = arguments.get('num_results', 5)
-                
-                if query:
-                    search_results, sources = await news_monitoring_search(query, num_results)
-                    output = f"📰 **News Monitoring:** {query}\n\n{search_results}"
-                    
-                    if sources:
-                        output += "\n\n📚 **News Sources:**\n"
-                        for source in sources:
-                            output += f"({source['number']}) {source['title']} - {source['domain']}\n"
-                else:
-                    output = "📰 No news monitoring query provided"
-                
-            else:
+            handler = VIVIAN_FUNCTION_HANDLERS.get(function_name)
+            if handler is None:
                 output = f"❓ Function {function_name} not implemented yet"
+            else:
+                async with tool_call_semaphore:
+                    if asyncio.iscoroutinefunction(handler):
+                        output = await handler(arguments)
+                    else:
+                        # Google API calls block - keep them off the event loop
+                        output = await loop.run_in_executor(None, handler, arguments)
                 
         except Exception as e:
             print(f"❌ Function execution error: {e}")
             output = f"❌ Error executing {function_name}: {str(e)}"
         
-        tool_outputs.append({
+        return {
             "tool_call_id": tool_call.id,
             "output": output[:1500]  # Keep within reasonable limits
-        })
+        }
     
-    # Submit tool outputs
-    try:
-        if tool_outputs:
-            client.beta.threads.runs.submit_tool_outputs(
-                thread_id=thread_id,
-                run_id=run.id,
-                tool_outputs=tool_outputs
-            )
-            print(f"✅ Submitted {len(tool_outputs)} tool outputs successfully")
-    except Exception as e:
-        print(f"❌ Error submitting tool outputs: {e}")
+    # Run every tool call of this step concurrently
+    tool_outputs = await asyncio.gather(
+        *(run_tool_call(tool_call) for tool_call in run.required_action.submit_tool_outputs.tool_calls)
+    )
+    return list(tool_outputs)
 
 # ============================================================================
 # MAIN CONVERSATION HANDLER
 # ============================================================================
 
-async def get_vivian_response(message, user_id):
-    """Get response from Vivian's enhanced OpenAI assistant"""
-    try:
-        if not ASSISTANT_ID:
-            return "⚠️ Vivian not configured - check VIVIAN_ASSISTANT_ID environment variable"
-        
-        if user_id in user_conversations and user_conversations[user_id].get('active', False):
-            return "💼 Vivian is currently analyzing your PR strategy. Please wait a moment..."
-        
-        if user_id not in user_conversations:
-            thread = client.beta.threads.create()
-            user_conversations[user_id] = {'thread_id': thread.id, 'active': False}
-            print(f"💼 Created PR thread for user {user_id}")
-        
-        user_conversations[user_id]['active'] = True
-        thread_id = user_conversations[user_id]['thread_id']
-        
-        clean_message = message.replace(f'<@{bot.user.id}>', '').strip() if hasattr(bot, 'user') and bot.user else message.strip()
-        
-        # Get current date context for Vivian
-        toronto_tz = pytz.timezone('America/Toronto')
-        now = datetime.now(toronto_tz)
-        today_formatted = now.strftime('%A, %B %d, %Y')
-        today_date = now.strftime('%Y-%m-%d')
-        tomorrow = now + timedelta(days=1)
-        tomorrow_formatted = tomorrow.strftime('%A, %B %d, %Y') 
-        tomorrow_date = tomorrow.strftime('%Y-%m-%d')
-
-        enhanced_message = f"""USER PR & COMMUNICATIONS REQUEST: {clean_message}
-
-CURRENT DATE & TIME CONTEXT:
+REQUEST_CONTEXT_TEMPLATE = """CURRENT DATE & TIME CONTEXT:
 - TODAY: {today_formatted} ({today_date})
 - TOMORROW: {tomorrow_formatted} ({tomorrow_date})
 - TIMEZONE: America/Toronto
+- AVAILABLE WORK CALENDARS: {calendars}
+- When user says "tomorrow" use {tomorrow_date} ({tomorrow_formatted})
+- When user says "today" use {today_date} ({today_formatted})"""
+
+@functools.lru_cache(maxsize=4)
+def render_request_context(today, calendar_names):
+    """Render the per-day date context added to each run's instructions"""
+    tomorrow = today + timedelta(days=1)
+    return REQUEST_CONTEXT_TEMPLATE.format_map({
+        'today_formatted': today.strftime('%A, %B %d, %Y'),
+        'today_date': today.isoformat(),
+        'tomorrow_formatted': tomorrow.strftime('%A, %B %d, %Y'),
+        'tomorrow_date': tomorrow.isoformat(),
+        'calendars': list(calendar_names)
+    })
+
+# Total time a run may take, tool calls included (seconds)
+RUN_TIMEOUT_SECONDS = 40
+
+VIVIAN_RUN_INSTRUCTIONS = """You are Vivian Spencer, PR & Communications specialist with work calendar integration and Rose coordination.
+
+PR & COMMUNICATIONS APPROACH:
+- Use work calendar functions to provide meeting prep and stakeholder coordination
+- Apply strategic communications perspective with media intelligence
+- Include actionable PR recommendations with timeline coordination
+
+FORMATTING: Use professional PR formatting with strategic headers (💼 📊 📰 🎯 📱) and provide organized, media-savvy guidance.
+
+STRUCTURE:
+💼 **PR Strategy:** [strategic overview with work calendar insights]
+📊 **Communications Analysis:** [research-backed PR recommendations]
+🎯 **Action Items:** [specific next steps with timing and stakeholder focus]
+
+Keep core content focused and always provide strategic context with work calendar coordination. Coordinate with Rose for comprehensive executive assistance.
 
 RESPONSE GUIDELINES:
 - Use professional PR/communications formatting with strategic headers
-- AVAILABLE WORK CALENDARS: {[name for name, _, _ in accessible_calendars]}
 - Apply PR specialist tone: strategic, media-savvy, stakeholder-focused
 - Keep main content under 1200 characters for Discord efficiency
 - Use headers like: 💼 **PR Strategy:** or 📊 **Communications Analysis:**
-- When user says "tomorrow" use {tomorrow_date} ({tomorrow_formatted})
-- When user says "today" use {today_date} ({today_formatted})
 - All times are in Toronto timezone (America/Toronto)
 - Focus on work calendar for meeting prep and stakeholder coordination"""
-        
+
+RUN_END_EVENTS = ('thread.run.completed', 'thread.run.failed', 'thread.run.cancelled',
+                  'thread.run.expired', 'thread.run.incomplete')
+
+# Only the most recent thread messages go into a run's context, so long-lived threads
+# don't grow the prompt forever (instructions are never truncated)
+RUN_HISTORY_MESSAGES = 20
+RUN_TRUNCATION_STRATEGY = {'type': 'last_messages', 'last_messages': RUN_HISTORY_MESSAGES}
+
+async def stream_vivian_run(thread_id, request_context):
+    """Run Vivian on a thread over a single event stream, answering tool calls as they arrive
+    
+    Returns the run's final status and the text of its last assistant message.
+    """
+    stream_manager = client.beta.threads.runs.stream(
+        thread_id=thread_id,
+        assistant_id=ASSISTANT_ID,
+        instructions=VIVIAN_RUN_INSTRUCTIONS,
+        additional_instructions=request_context,
+        truncation_strategy=RUN_TRUNCATION_STRATEGY
+    )
+    status = None
+    response = None
+    
+    while stream_manager is not None:
+        async with stream_manager as stream:
+            stream_manager = None
+            async for event in stream:
+                logger.debug("🔄 Run event: %s", event.event)
+                
+                if event.event == 'thread.run.created':
+                    print(f"💼 Vivian run created: {event.data.id}")
+                elif event.event == 'thread.message.completed' and event.data.role == 'assistant':
+                    response = ''.join(part.text.value for part in event.data.content if part.type == 'text')
+                elif event.event == 'thread.run.requires_action':
+                    status = event.data.status
+                    tool_outputs = await handle_vivian_functions_enhanced(event.data)
+                    if not tool_outputs:
+                        break
+                    # The run pauses here and resumes on a new stream once outputs are in
+                    stream_manager = client.beta.threads.runs.submit_tool_outputs_stream(
+                        thread_id=thread_id,
+                        run_id=event.data.id,
+                        tool_outputs=tool_outputs
+                    )
+                    print(f"✅ Submitting {len(tool_outputs)} tool outputs")
+                    break
+                elif event.event in RUN_END_EVENTS:
+                    status = event.data.status
+    
+    return status, response
+
+# A user who immediately re-sends their previous question gets the previous reply back,
+# unless the answer depends on the clock, the calendar or the inbox. Only the user's
+# last turn is kept, so a reply is never replayed into a conversation that has moved on
+RESPONSE_CACHE_TTL = 900
+response_cache = LRUDict(MAX_TRACKED_USERS)
+TIME_SENSITIVE_WORDS = frozenset({
+    'today', 'tonight', 'tomorrow', 'yesterday', 'now', 'current', 'currently', 'latest',
+    'recent', 'new', 'news', 'week', 'upcoming', 'next', 'schedule', 'calendar', 'agenda',
+    'meeting', 'meetings', 'email', 'emails', 'inbox', 'briefing', 'morning'
+})
+
+def get_response_cache_key(clean_message):
+    """Normalized question for the reply cache, or None when it is time-sensitive"""
+    words = WORD_RE.findall(clean_message.lower())
+    if not words or not TIME_SENSITIVE_WORDS.isdisjoint(words):
+        return None
+    return ' '.join(words)
+
+def get_cached_response(user_id, question_key):
+    """The user's last reply if this question repeats their last turn, otherwise None
+    
+    Anything but a repeat starts a new turn, so the previous reply is dropped.
+    """
+    cached = response_cache.pop(user_id, None)
+    if question_key is None or cached is None:
+        return None
+    expires_at, cached_question, response = cached
+    if cached_question != question_key or time.monotonic() >= expires_at:
+        return None
+    response_cache[user_id] = cached
+    return response
+
+def cache_response(user_id, question_key, response):
+    """Remember a completed reply as the user's last turn (a None key means don't cache)"""
+    if question_key is not None:
+        response_cache[user_id] = (time.monotonic() + RESPONSE_CACHE_TTL, question_key, response)
+    return response
+
+@functools.lru_cache(maxsize=2)
+def get_mention_re(bot_id):
+    """Both forms of a mention of the bot: <@ID> and the nickname form <@!ID>"""
+    return re.compile(rf'<@!?{bot_id}>')
+
+def strip_bot_mention(message):
+    """Remove mentions of the bot from a message"""
+    if getattr(bot, 'user', None):
+        message = get_mention_re(bot.user.id).sub('', message)
+    return message.strip()
+
+# How long to keep retrying a message while an earlier run on the thread finishes
+ACTIVE_RUN_MAX_WAIT = 8
+
+def is_active_run_error(error):
+    """True if the API refused a thread change because a run is still in progress"""
+    text = str(error)
+    return "while a run" in text and "is active" in text
+
+async def add_message_when_idle(thread_id, content):
+    """Add a user message, backing off with jitter while an earlier run is still active"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + ACTIVE_RUN_MAX_WAIT
+    delay = 0.25
+    while True:
         try:
-            client.beta.threads.messages.create(
+            await client.beta.threads.messages.create(
                 thread_id=thread_id,
                 role="user",
-                content=enhanced_message
+                content=content
             )
+            return
         except Exception as e:
-            if "while a run" in str(e) and "is active" in str(e):
-                print("⏳ Waiting for previous PR analysis to complete...")
-                await asyncio.sleep(3)
-                try:
-                    client.beta.threads.messages.create(
-                        thread_id=thread_id,
-                        role="user",
-                        content=enhanced_message
-                    )
-                except Exception as e2:
-                    print(f"❌ Still can't add message: {e2}")
-                    return "💼 PR office is busy. Please try again in a moment."
+            if not is_active_run_error(e) or loop.time() + delay > deadline:
+                raise
+            print(f"⏳ Waiting for previous PR analysis to complete (retry in {delay:.2f}s)...")
+            await asyncio.sleep(delay + random.random() * 0.1)
+            delay = min(delay * 2, 2.0)
+
+async def run_vivian_request(message, user_id):
+    """Run one request on the user's assistant thread (caller holds the user's lock)"""
+    try:
+        created_thread = False
+        if user_id not in user_conversations:
+            stored_thread_id = await asyncio.to_thread(load_thread_id, user_id)
+            if stored_thread_id:
+                user_conversations[user_id] = {'thread_id': stored_thread_id}
+                print(f"💼 Resumed PR thread for user {user_id}")
             else:
+                thread = await client.beta.threads.create()
+                user_conversations[user_id] = {'thread_id': thread.id}
+                run_in_background(store_thread_id(user_id, thread.id))
+                created_thread = True
+                print(f"💼 Created PR thread for user {user_id}")
+        
+        thread_id = user_conversations[user_id]['thread_id']
+        if not created_thread:
+            # Keeps the stored row's recency current, so pruning drops idle users first
+            run_in_background(asyncio.to_thread(touch_thread_id, user_id))
+        
+        clean_message = strip_bot_mention(message)
+        
+        cache_key = get_response_cache_key(clean_message)
+        cached_response = get_cached_response(user_id, cache_key)
+        if cached_response:
+            print(f"⚡ Reusing recent PR reply for user {user_id}")
+            return cached_response
+        
+        # Date context rides on the run, not the message, so it isn't stored in the thread
+        # and re-read on every later turn. It only changes once a day, so it is cached
+        today = datetime.now(TORONTO_TZ).date()
+        calendar_names = tuple(name for name, _ in accessible_calendars)
+        request_context = render_request_context(today, calendar_names)
+        
+        try:
+            await add_message_when_idle(thread_id, clean_message)
+        except Exception as e:
+            if is_active_run_error(e):
+                print(f"❌ Still can't add message: {e}")
+                return "💼 PR office is busy. Please try again in a moment."
+            else:
+                if isinstance(e, NotFoundError):
+                    # Stored thread no longer exists - start a fresh one next time
+                    user_conversations.pop(user_id, None)
+                    run_in_background(asyncio.to_thread(forget_thread_id, user_id))
                 print(f"❌ Message creation error: {e}")
                 return "❌ Error creating PR message. Please try again."
         
         try:
-            run = client.beta.threads.runs.create(
-                thread_id=thread_id,
-                assistant_id=ASSISTANT_ID,
-                instructions="""You are Vivian Spencer, PR & Communications specialist with work calendar integration and Rose coordination.
-
-PR & COMMUNICATIONS APPROACH:
-- Use work calendar functions to provide meeting prep and stakeholder coordination
-- Apply strategic communications perspective with media intelligence
-- Include actionable PR recommendations with timeline coordination
-
-FORMATTING: Use professional PR formatting with strategic headers (💼 📊 📰 🎯 📱) and provide organized, media-savvy guidance.
-
-STRUCTURE:
-💼 **PR Strategy:** [strategic overview with work calendar insights]
-📊 **Communications Analysis:** [research-backed PR recommendations]
-🎯 **Action Items:** [specific next steps with timing and stakeholder focus]
-
-Keep core content focused and always provide strategic context with work calendar coordination. Coordinate with Rose for comprehensive executive assistance."""
-            )
+            status, response = await asyncio.wait_for(stream_vivian_run(thread_id, request_context), RUN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            print("⏱️ Run timed out")
+            return "⏱️ PR office is busy. Please try again in a moment."
         except Exception as e:
-            print(f"❌ Run creation error: {e}")
-            return "❌ Error starting PR analysis. Please try again."
+            print(f"❌ Run error: {e}")
+            return "❌ Error running PR analysis. Please try again."
         
-        print(f"💼 Vivian run created: {run.id}")
+        if status != "completed":
+            print(f"❌ Run {status}")
+            return "❌ PR analysis interrupted. Please try again."
         
-        for attempt in range(20):
-            try:
-                run_status = client.beta.threads.runs.retrieve(
-                    thread_id=thread_id,
-                    run_id=run.id
-                )
-            except Exception as e:
-                print(f"❌ Error retrieving run status: {e}")
-                await asyncio.sleep(2)
-                continue
-            
-            print(f"🔄 Status: {run_status.status} (attempt {attempt + 1})")
-            
-            if run_status.status == "completed":
-                break
-            elif run_status.status == "requires_action":
-                await handle_vivian_functions_enhanced(run_status, thread_id)
-            elif run_status.status in ["failed", "cancelled", "expired"]:
-                print(f"❌ Run {run_status.status}")
-                return "❌ PR analysis interrupted. Please try again."
-            
-            await asyncio.sleep(2)
-        else:
-            print("⏱️ Run timed out")
-            return "⏱️ PR office is busy. Please try again in a moment."
+        if response:
+            return cache_response(user_id, cache_key, format_for_discord_vivian(response))
         
+        # The stream ended without a completed message event - read the thread instead
         try:
-            messages = client.beta.threads.messages.list(thread_id=thread_id, limit=5)
+            # Only the newest message matters - it is the run's reply
+            messages = await client.beta.threads.messages.list(thread_id=thread_id, limit=1, order='desc')
             for msg in messages.data:
                 if msg.role == "assistant":
                     response = msg.content[0].text.value
-                    return format_for_discord_vivian(response)
+                    return cache_response(user_id, cache_key, format_for_discord_vivian(response))
         except Exception as e:
             print(f"❌ Error retrieving messages: {e}")
             return "❌ Error retrieving PR guidance. Please try again."
@@ -1105,12 +1646,56 @@ Keep core content focused and always provide strategic context with work calenda
         return "💼 PR analysis unclear. Please try again with a different approach."
         
     except Exception as e:
-        print(f"❌ Vivian error: {e}")
-        print(f"📋 Full traceback: {traceback.format_exc()}")
+        logger.exception("❌ Vivian error: %s", e)
         return "❌ Something went wrong with PR strategy. Please try again!"
-    finally:
-        if user_id in user_conversations:
-            user_conversations[user_id]['active'] = False
+
+# One lock per user so only one run is ever active on their thread; entries
+# disappear once no request holds the lock
+user_locks = weakref.WeakValueDictionary()
+
+def get_user_lock(user_id):
+    """Get the lock serializing a user's assistant runs"""
+    lock = user_locks.get(user_id)
+    if lock is None:
+        lock = user_locks[user_id] = asyncio.Lock()
+    return lock
+
+# Per-user token bucket: bursts of up to RATE_LIMIT_BURST requests, refilling to that many every RATE_LIMIT_WINDOW seconds
+RATE_LIMIT_BURST = 5
+RATE_LIMIT_WINDOW = 30
+rate_limit_buckets = LRUDict(MAX_TRACKED_USERS)
+
+def take_request_token(user_id):
+    """Spend one of the user's request tokens, or return False if they are out"""
+    now = time.monotonic()
+    tokens, refilled_at = rate_limit_buckets.get(user_id, (RATE_LIMIT_BURST, now))
+    tokens = min(RATE_LIMIT_BURST, tokens + (now - refilled_at) * RATE_LIMIT_BURST / RATE_LIMIT_WINDOW)
+    allowed = tokens >= 1
+    rate_limit_buckets[user_id] = (tokens - 1 if allowed else tokens, now)
+    return allowed
+
+async def get_vivian_response(message, user_id):
+    """Get response from Vivian's enhanced OpenAI assistant"""
+    if not ASSISTANT_ID:
+        return "⚠️ Vivian not configured - check VIVIAN_ASSISTANT_ID environment variable"
+    
+    # Mentions pass int ids and commands pass strings - one key for the thread map,
+    # locks, rate limiter, response cache and thread store
+    user_id = str(user_id)
+    
+    lock = get_user_lock(user_id)
+    if lock.locked():
+        return "💼 Vivian is currently analyzing your PR strategy. Please wait a moment..."
+    
+    # Checked after the lock so a message turned away as concurrent isn't charged
+    if not take_request_token(user_id):
+        return "⏳ Slow down - Vivian needs a few seconds before the next PR request."
+    
+    async with lock:
+        return await run_vivian_request(message, user_id)
+
+# Runs of 3+ newlines collapse to a single blank line
+EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
 
 def format_for_discord_vivian(response):
     """Format response for Discord with error handling"""
@@ -1118,11 +1703,16 @@ def format_for_discord_vivian(response):
         if not response or not isinstance(response, str):
             return "💼 PR strategy processing. Please try again."
         
-        response = response.replace('\n\n\n\n', '\n\n')
-        response = response.replace('\n\n\n', '\n\n')
+        # Most replies fit and have no blank-line runs - skip the regex pass entirely
+        if len(response) <= 1900 and '\n\n\n' not in response:
+            return response.strip()
+        
+        response = EXCESS_NEWLINES_RE.sub('\n\n', response)
         
         if len(response) > 1900:
-            response = response[:1900] + "\n\n💼 *(PR insights continue)*"
+            # End on the last full sentence in range, unless that would drop too much
+            cut = response.rfind('. ', 0, 1900)
+            response = (response[:cut + 1] if cut > 950 else response[:1900]) + "\n\n💼 *(PR insights continue)*"
         
         return response.strip()
         
@@ -1134,27 +1724,34 @@ def format_for_discord_vivian(response):
 # ENHANCED MESSAGE HANDLING
 # ============================================================================
 
+def split_message_chunks(response, limit=1900):
+    """Split a long response on line breaks into chunks of about limit characters"""
+    # Collect lines and a running length, joining once per chunk instead of growing a string
+    chunks = []
+    lines = []
+    length = 0
+    
+    for line in response.split('\n'):
+        line_length = len(line) + 1
+        if lines and length + line_length > limit:
+            chunks.append('\n'.join(lines).strip())
+            lines = []
+            length = 0
+        lines.append(line)
+        length += line_length
+    
+    if lines:
+        chunks.append('\n'.join(lines).strip())
+    
+    return [chunk for chunk in chunks if chunk]
+
 async def send_long_message(original_message, response):
     """Send response with length handling and error recovery"""
     try:
         if len(response) <= 2000:
             await original_message.reply(response)
         else:
-            chunks = []
-            current_chunk = ""
-            
-            for line in response.split('\n'):
-                if len(current_chunk + line + '\n') > 1900:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = line + '\n'
-                else:
-                    current_chunk += line + '\n'
-            
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            
-            for i, chunk in enumerate(chunks):
+            for i, chunk in enumerate(split_message_chunks(response)):
                 if i == 0:
                     await original_message.reply(chunk)
                 else:
@@ -1184,15 +1781,16 @@ async def on_ready():
         print(f" API Key: ✅ Configured")
         print(f" Search Functionality: ✅ PR Research & News Monitoring Ready")
     
-    # Initialize Google services (call again in case of startup timing issues)
-    initialize_google_services()
+    # Initialize Google services here rather than at import so startup isn't blocked;
+    # on_ready fires again on reconnects, which is a no-op once services are up
+    await ensure_google_services()
     
     # Initialize scheduler for automated briefings
     try:
         # Schedule work briefing at 9:00 AM Toronto time (weekdays only)
         scheduler.add_job(
             send_automated_work_briefing,
-            CronTrigger(hour=9, minute=0, timezone=pytz.timezone('America/Toronto')),
+            CronTrigger(hour=9, minute=0, timezone=TORONTO_TZ),
             id='daily_work_briefing',
             replace_existing=True
         )
@@ -1200,7 +1798,7 @@ async def on_ready():
         # Schedule work review at 4:30 PM Toronto time (weekdays only)
         scheduler.add_job(
             send_automated_work_review,
-            CronTrigger(hour=16, minute=30, timezone=pytz.timezone('America/Toronto')),
+            CronTrigger(hour=16, minute=30, timezone=TORONTO_TZ),
             id='daily_work_review',
             replace_existing=True
         )
@@ -1230,51 +1828,38 @@ async def on_ready():
         )
     )
 
+# Rose's Vivian request pattern and the briefing commands Vivian answers,
+# compiled once so each message is checked in a single pass
+VIVIAN_MENTION_RE = re.compile(r'@vivian spencer', re.IGNORECASE)
+ROSE_REQUEST_TOPIC_RE = re.compile(r'work briefing|pr context|calendar details', re.IGNORECASE)
+BRIEFING_COMMAND_RE = re.compile(r'\s*!(?:briefing|am|noon|pm|quickbriefing|teambriefing vivian)', re.IGNORECASE)
+
 def is_rose_vivian_request(message):
     """Detect Rose's specific Vivian request pattern"""
-    content = message.content.lower()
-    
-    # Look for Rose's specific Vivian request pattern
-    rose_vivian_patterns = [
-        '@vivian spencer' in content and 'work briefing' in content,
-        '@vivian spencer' in content and 'pr context' in content,
-        '@vivian spencer' in content and 'comprehensive work briefing' in content,
-        '@vivian spencer' in content and 'calendar details' in content
-    ]
-    
-    # Check if message is from Rose bot
+    # Check if message is from Rose bot first - it's cheap and rules out most messages
     is_from_rose = (
         message.author.bot and
         ('rose' in message.author.display_name.lower() or 'Rose Ashcombe' in str(message.author))
     )
+    if not is_from_rose:
+        return False
     
-    detected = any(rose_vivian_patterns) and is_from_rose
+    # Look for Rose's specific Vivian request pattern
+    content = message.content
+    detected = bool(VIVIAN_MENTION_RE.search(content) and ROSE_REQUEST_TOPIC_RE.search(content))
     
     if detected:
         print(f"🌹 Rose Vivian request detected from {message.author.display_name}")
-        print(f"🌹 Content preview: {content[:100]}...")
+        logger.debug("🌹 Content preview: %.100s...", content)
     
     return detected
 
 def is_briefing_command(message):
     """Detect briefing commands that Vivian should respond to"""
-    content = message.content.lower().strip()
-    
-    # Check for briefing commands
-    briefing_commands = [
-        content.startswith('!briefing'),
-        content.startswith('!am'),
-        content.startswith('!noon'),
-        content.startswith('!pm'),
-        content.startswith('!quickbriefing'),
-        content.startswith('!teambriefing vivian'),
-        content.startswith('!teambriefing vivian spencer')
-    ]
-    
-    detected = any(briefing_commands)
+    detected = BRIEFING_COMMAND_RE.match(message.content) is not None
     
     if detected:
-        print(f"💼 Vivian briefing command detected: {content[:50]}...")
+        logger.debug("💼 Vivian briefing command detected: %.50s...", message.content.strip())
     
     return detected
 
@@ -1282,7 +1867,7 @@ async def handle_rose_briefing_request(message):
     """Provide Vivian briefing response using static template"""
     try:
         async with message.channel.typing():
-            briefing_response = get_vivian_report()
+            briefing_response = await asyncio.to_thread(get_vivian_report)
             await send_as_assistant_bot(message.channel, briefing_response, "Vivian Spencer")
             print(f"✨ Vivian provided static briefing response in #{message.channel.name}")
             
@@ -1315,29 +1900,47 @@ def get_vivian_report(events=None, brief=False):
 # ENHANCED WORK BRIEFING FUNCTIONS
 # ============================================================================
 
+# A1 range of the briefing tab, resolved from VIVIAN_SHEET_GID on first read
+briefing_sheet_range = None
+
+def get_briefing_sheet_range():
+    """Range covering the briefing tab picked by VIVIAN_SHEET_GID (the first sheet if it isn't found)"""
+    global briefing_sheet_range
+    if briefing_sheet_range is None:
+        range_name = 'A:Z'
+        if VIVIAN_SHEET_GID:
+            spreadsheet = execute_with_retry(sheets_service.spreadsheets().get(
+                spreadsheetId=VIVIAN_DRIVE_FILE_ID,
+                fields='sheets.properties(sheetId,title)'
+            ))
+            for sheet in spreadsheet.get('sheets', []):
+                properties = sheet.get('properties', {})
+                if str(properties.get('sheetId')) == VIVIAN_SHEET_GID:
+                    # Quotes in a sheet title are escaped by doubling them
+                    title = properties['title'].replace("'", "''")
+                    range_name = f"'{title}'!A:Z"
+                    break
+            else:
+                print(f"⚠️ No sheet with gid {VIVIAN_SHEET_GID} - reading the first sheet")
+        briefing_sheet_range = range_name
+    return briefing_sheet_range
+
 def read_briefing_notes():
     """Read the current briefing notes from Google Sheets or fallback to local file"""
     try:
         # First try to read from Google Sheets if service is available
-        if calendar_service:  # Using same credentials as calendar
+        if sheets_service:  # Built once at startup with the calendar credentials
             try:
-                drive_file_id = os.getenv('VIVIAN_DRIVE_FILE_ID', '1s42vLc5n3VildpkdVdBMyMNFPzBcXqggqlB4E758Nq4')
-                sheet_gid = os.getenv('VIVIAN_SHEET_GID', '747232342')  # Default to the gid from your URL
+                drive_file_id = VIVIAN_DRIVE_FILE_ID
                 
                 if drive_file_id:
-                    # Build Google Sheets service using same credentials
-                    from googleapiclient.discovery import build
-                    oauth_credentials = calendar_service._http.credentials
-                    sheets_service = build('sheets', 'v4', credentials=oauth_credentials)
+                    # Read all columns of the tab VIVIAN_SHEET_GID points at
+                    range_name = get_briefing_sheet_range()
                     
-                    # Read the specific sheet (using the gid to determine sheet name or index)
-                    # For now, we'll read the first sheet - you can specify sheet name if needed
-                    range_name = 'A:Z'  # Read all columns
-                    
-                    result = sheets_service.spreadsheets().values().get(
+                    result = execute_with_retry(sheets_service.spreadsheets().values().get(
                         spreadsheetId=drive_file_id,
                         range=range_name
-                    ).execute()
+                    ))
                     
                     values = result.get('values', [])
                     
@@ -1350,16 +1953,15 @@ def read_briefing_notes():
                         print("⚠️ Google Sheets is empty")
                         
             except Exception as drive_error:
+                # The tab may have been renamed - look its title up again next time
+                global briefing_sheet_range
+                briefing_sheet_range = None
                 print(f"⚠️ Google Sheets read failed: {drive_error}")
                 print("🔄 Falling back to local file...")
         
         # Fallback to local file (existing behavior)
-        import os
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        notes_file = os.path.join(script_dir, "vivian_work_briefings.txt")
-        
-        if os.path.exists(notes_file):
-            with open(notes_file, 'r', encoding='utf-8') as file:
+        if os.path.exists(BRIEFING_NOTES_FILE):
+            with open(BRIEFING_NOTES_FILE, 'r', encoding='utf-8') as file:
                 content = file.read()
             print("✅ Briefing notes loaded from local file")
             return content
@@ -1408,7 +2010,7 @@ def get_work_calendar_summary():
         today_events = get_work_schedule_today()
         
         # Get upcoming work events (next 3 days)
-        upcoming_events = get_work_schedule_upcoming(3)
+        upcoming_events = get_work_upcoming_events(3)
         
         return f"""📅 **Calendar Integration**
 
@@ -1449,7 +2051,7 @@ def parse_briefing_sections(briefing_notes):
 
 def generate_work_briefing_embeds(briefing_type="morning"):
     """Generate work briefing as Discord embeds with proper formatting"""
-    toronto_tz = pytz.timezone('America/Toronto')
+    toronto_tz = TORONTO_TZ
     current_time = datetime.now(toronto_tz)
     
     # Read and parse briefing notes
@@ -1571,7 +2173,7 @@ def generate_work_review():
 @bot.event
 async def on_error(event, *args, **kwargs):
     """Global error handler"""
-    print(f"❌ Discord error in {event}: {traceback.format_exc()}")
+    logger.exception("❌ Discord error in %s", event)
 
 @bot.event
 async def on_message(message):
@@ -1597,23 +2199,24 @@ async def on_message(message):
             
             try:
                 # Forward to n8n fabric expert workflow
-                async with aiohttp.ClientSession() as session:
-                    payload = {
-                        'content': message.content,
-                        'channel_name': message.channel.name,
-                        'channel_id': str(message.channel.id),
-                        'id': str(message.id),
-                        'author': {
-                            'username': message.author.name,
-                            'bot': message.author.bot
-                        }
+                payload = {
+                    'content': message.content,
+                    'channel_name': message.channel.name,
+                    'channel_id': str(message.channel.id),
+                    'id': str(message.id),
+                    'author': {
+                        'username': message.author.name,
+                        'bot': message.author.bot
                     }
-                    
-                    # n8n fabric expert webhook URL
-                    n8n_webhook_url = "https://briefsubstance.app.n8n.cloud/webhook/fabric-expert"
-                    
-                    await session.post(n8n_webhook_url, json=payload)
-                    print(f"🧵 Forwarded fabric question to n8n: {message.content[:50]}...")
+                }
+                
+                # n8n fabric expert webhook URL
+                n8n_webhook_url = "https://briefsubstance.app.n8n.cloud/webhook/fabric-expert"
+                
+                # Release the response so the pooled connection can be reused
+                async with get_http_session().post(n8n_webhook_url, json=payload):
+                    pass
+                print(f"🧵 Forwarded fabric question to n8n: {message.content[:50]}...")
             except Exception as e:
                 print(f"❌ Error forwarding to n8n: {e}")
             return
@@ -1639,8 +2242,7 @@ async def on_message(message):
                     response = await get_vivian_response(message.content, message.author.id)
                     await send_long_message(message, response)
             except Exception as e:
-                print(f"❌ Message error: {e}")
-                print(f"📋 Message traceback: {traceback.format_exc()}")
+                logger.exception("❌ Message error: %s", e)
                 try:
                     await message.reply("❌ Something went wrong with PR consultation. Please try again!")
                 except:
@@ -1649,8 +2251,7 @@ async def on_message(message):
                 processing_messages.discard(message_key)
                     
     except Exception as e:
-        print(f"❌ Message event error: {e}")
-        print(f"📋 Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Message event error: %s", e)
 
 # ============================================================================
 # ENHANCED COMMANDS
@@ -1667,6 +2268,57 @@ async def ping_command(ctx):
         print(f"❌ Ping command error: {e}")
         await ctx.send("💼 PR ping experiencing issues.")
 
+def build_help_fields(config):
+    """Help embed fields as (name, value) pairs - the text never changes, so it is built once"""
+    # Commands - Split into sections for better organization
+    calendar_commands = [
+        "!workbriefing - 🌅 Comprehensive 9 AM work briefing with strategic context",
+        "!workreview - 🌆 End-of-day 4:45 PM review and tomorrow's prep",
+        "!work-briefing - Work morning briefing with PR context and email summary",
+        "!work-today - Today's work schedule", 
+        "!work-upcoming [days] - Upcoming work events (default: 7)",
+        "!work-schedule [timeframe] - Flexible work schedule view",
+        "!work-agenda - Comprehensive work agenda overview"
+    ]
+    
+    email_commands = [
+        "!priority-emails - Show unread priority emails",
+        "!email-status - Email metrics and inbox overview"
+    ]
+    
+    pr_commands = [
+        "!pr-research <query> - Strategic PR research",
+        "!news-monitor <query> - News monitoring and analysis",
+        "!communications <topic> - Communications strategy insights"
+    ]
+    
+    integration_commands = [
+        "!export-for-rose - Export work data for Rose coordination",
+        "!coordinate-with-rose - Coordinate scheduling with Rose"
+    ]
+    
+    system_commands = [
+        "!status - System status",
+        "!ping - Test response time",
+        "!help - This message"
+    ]
+    
+    return (
+        # Main usage
+        ("💬 AI Assistant", f"• Mention @{config['name']} for advanced PR assistance\n• Work calendar management with communications context\n• Strategic PR research and stakeholder coordination"),
+        ("📅 Work Calendar & Scheduling", "\n".join([f"• {cmd}" for cmd in calendar_commands])),
+        ("📧 Email Management", "\n".join([f"• {cmd}" for cmd in email_commands])),
+        ("🔍 PR & Communications Research", "\n".join([f"• {cmd}" for cmd in pr_commands])),
+        ("🤝 Rose Integration", "\n".join([f"• {cmd}" for cmd in integration_commands])),
+        ("⚙️ System", "\n".join([f"• {cmd}" for cmd in system_commands])),
+        # Example requests
+        ("💡 Example AI Requests", "\n".join([f"• {req}" for req in config['example_requests'][:3]])),
+        # Channels
+        ("🎯 Active Channels", ", ".join([f"#{ch}" for ch in config['channels']]))
+    )
+
+HELP_FIELDS = build_help_fields(ASSISTANT_CONFIG)
+
 @bot.command(name='help')
 async def help_command(ctx):
     """Enhanced help command with Discord embeds"""
@@ -1680,89 +2332,8 @@ async def help_command(ctx):
             color=config['color']
         )
         
-        # Main usage
-        embed.add_field(
-            name="💬 AI Assistant",
-            value=f"• Mention @{config['name']} for advanced PR assistance\n• Work calendar management with communications context\n• Strategic PR research and stakeholder coordination",
-            inline=False
-        )
-        
-        # Commands - Split into sections for better organization
-        calendar_commands = [
-            "!workbriefing - 🌅 Comprehensive 9 AM work briefing with strategic context",
-            "!workreview - 🌆 End-of-day 4:45 PM review and tomorrow's prep",
-            "!work-briefing - Work morning briefing with PR context and email summary",
-            "!work-today - Today's work schedule", 
-            "!work-upcoming [days] - Upcoming work events (default: 7)",
-            "!work-schedule [timeframe] - Flexible work schedule view",
-            "!work-agenda - Comprehensive work agenda overview"
-        ]
-        
-        email_commands = [
-            "!priority-emails - Show unread priority emails",
-            "!email-status - Email metrics and inbox overview"
-        ]
-        
-        pr_commands = [
-            "!pr-research <query> - Strategic PR research",
-            "!news-monitor <query> - News monitoring and analysis",
-            "!communications <topic> - Communications strategy insights"
-        ]
-        
-        integration_commands = [
-            "!export-for-rose - Export work data for Rose coordination",
-            "!coordinate-with-rose - Coordinate scheduling with Rose"
-        ]
-        
-        system_commands = [
-            "!status - System status",
-            "!ping - Test response time",
-            "!help - This message"
-        ]
-        
-        embed.add_field(
-            name="📅 Work Calendar & Scheduling",
-            value="\n".join([f"• {cmd}" for cmd in calendar_commands]),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📧 Email Management",
-            value="\n".join([f"• {cmd}" for cmd in email_commands]),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔍 PR & Communications Research",
-            value="\n".join([f"• {cmd}" for cmd in pr_commands]),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🤝 Rose Integration",
-            value="\n".join([f"• {cmd}" for cmd in integration_commands]),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚙️ System",
-            value="\n".join([f"• {cmd}" for cmd in system_commands]),
-            inline=False
-        )
-        
-        # Example requests
-        embed.add_field(
-            name="💡 Example AI Requests",
-            value="\n".join([f"• {req}" for req in config['example_requests'][:3]]),
-            inline=False
-        )
-        
-        # Channels
-        embed.add_field(
-            name="🎯 Active Channels",
-            value=", ".join([f"#{ch}" for ch in config['channels']]),
-            inline=False
-        )
+        for name, value in HELP_FIELDS:
+            embed.add_field(name=name, value=value, inline=False)
         
         await ctx.send(embed=embed)
         
@@ -1841,7 +2412,7 @@ async def work_today_command(ctx):
     
     try:
         async with ctx.typing():
-            schedule = get_work_schedule_today()
+            schedule = await asyncio.to_thread(get_work_schedule_today)
             await ctx.send(schedule)
     except Exception as e:
         print(f"❌ Work today command error: {e}")
@@ -1854,7 +2425,7 @@ async def work_upcoming_command(ctx, days: int = 7):
     try:
         async with ctx.typing():
             days = max(1, min(days, 30))
-            events = get_work_upcoming_events(days)
+            events = await asyncio.to_thread(get_work_upcoming_events, days)
             await ctx.send(events)
     except Exception as e:
         print(f"❌ Work upcoming command error: {e}")
@@ -1866,7 +2437,7 @@ async def work_briefing_command(ctx):
     
     try:
         async with ctx.typing():
-            briefing = get_work_morning_briefing()
+            briefing = await asyncio.to_thread(get_work_morning_briefing)
             await ctx.send(briefing)
     except Exception as e:
         print(f"❌ Work briefing command error: {e}")
@@ -1878,7 +2449,7 @@ async def work_daily_command(ctx):
     
     try:
         async with ctx.typing():
-            briefing = get_work_morning_briefing()
+            briefing = await asyncio.to_thread(get_work_morning_briefing)
             await ctx.send(briefing)
     except Exception as e:
         print(f"❌ Work daily command error: {e}")
@@ -1890,12 +2461,16 @@ async def work_morning_command(ctx):
     
     try:
         async with ctx.typing():
-            briefing = get_work_morning_briefing()
+            briefing = await asyncio.to_thread(get_work_morning_briefing)
             await ctx.send(briefing)
     except Exception as e:
         print(f"❌ Work morning command error: {e}")
         await ctx.send("💼 Work morning briefing unavailable. Please try again.")
 
+# Numeric timeframes like "3", "10 days" or "2 weeks"
+TIMEFRAME_RE = re.compile(r'(\d+)\s*(day|week|month)?')
+TIMEFRAME_UNIT_DAYS = {'day': 1, 'week': 7, 'month': 30}
+
 @bot.command(name='work-schedule')
 async def work_schedule_command(ctx, *, timeframe: str = "today"):
     """Flexible work schedule command"""
@@ -1903,21 +2478,22 @@ async def work_schedule_command(ctx, *, timeframe: str = "today"):
     try:
         async with ctx.typing():
             timeframe_lower = timeframe.lower()
+            timeframe_match = TIMEFRAME_RE.search(timeframe_lower)
             
             if any(word in timeframe_lower for word in ["today", "now", "current"]):
-                response = get_work_schedule_today()
-            elif any(word in timeframe_lower for word in ["tomorrow", "next"]):
-                response = get_work_upcoming_events(1)
-            elif any(word in timeframe_lower for word in ["week", "7"]):
-                response = get_work_upcoming_events(7)
-            elif any(word in timeframe_lower for word in ["month", "30"]):
-                response = get_work_upcoming_events(30)
-            elif timeframe_lower.isdigit():
-                days = int(timeframe_lower)
+                response = await asyncio.to_thread(get_work_schedule_today)
+            elif timeframe_match:
+                days = int(timeframe_match.group(1)) * TIMEFRAME_UNIT_DAYS.get(timeframe_match.group(2), 1)
                 days = max(1, min(days, 30))
-                response = get_work_upcoming_events(days)
+                response = await asyncio.to_thread(get_work_upcoming_events, days)
+            elif any(word in timeframe_lower for word in ["tomorrow", "next"]):
+                response = await asyncio.to_thread(get_work_upcoming_events, 1)
+            elif "week" in timeframe_lower:
+                response = await asyncio.to_thread(get_work_upcoming_events, 7)
+            elif "month" in timeframe_lower:
+                response = await asyncio.to_thread(get_work_upcoming_events, 30)
             else:
-                response = get_work_schedule_today()
+                response = await asyncio.to_thread(get_work_schedule_today)
             
             await ctx.send(response)
     except Exception as e:
@@ -1930,8 +2506,10 @@ async def work_agenda_command(ctx):
     
     try:
         async with ctx.typing():
-            today_schedule = get_work_schedule_today()
-            tomorrow_events = get_work_upcoming_events(1)
+            today_schedule, tomorrow_events = await asyncio.gather(
+                asyncio.to_thread(get_work_schedule_today),
+                asyncio.to_thread(get_work_upcoming_events, 1)
+            )
             
             agenda = f"📋 **Work Agenda Overview**\n\n{today_schedule}\n\n**Tomorrow:**\n{tomorrow_events}"
             
@@ -1949,7 +2527,7 @@ async def export_for_rose_command(ctx):
     
     try:
         async with ctx.typing():
-            export_data = export_work_data_for_rose()
+            export_data = await asyncio.to_thread(export_work_data_for_rose)
             
             if export_data['status'] == 'success':
                 response = f"📊 **Work Data Export for Rose:**\n\n{export_data['message']}\n\n"
@@ -2068,7 +2646,7 @@ async def workbriefing_command(ctx):
         print("🌅 Generating comprehensive work briefing...")
         
         # Generate the comprehensive briefing embeds
-        briefing_embeds = generate_work_briefing_embeds(briefing_type="morning")
+        briefing_embeds = await asyncio.to_thread(generate_work_briefing_embeds, "morning")
         
         # Send each embed with a small delay for better presentation
         for i, embed in enumerate(briefing_embeds):
@@ -2079,9 +2657,7 @@ async def workbriefing_command(ctx):
         print("✅ Work briefing sent successfully")
         
     except Exception as e:
-        print(f"❌ Work briefing command error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Work briefing command error: %s", e)
         await ctx.send("💼 Work briefing unavailable. Please try again.")
 
 @bot.command(name='workreview')
@@ -2092,7 +2668,7 @@ async def workreview_command(ctx):
         print("🌆 Generating end-of-day work review...")
         
         # Generate the review briefing embeds
-        review_embeds = generate_work_briefing_embeds(briefing_type="review")
+        review_embeds = await asyncio.to_thread(generate_work_briefing_embeds, "review")
         
         # Send each embed with a small delay for better presentation
         for i, embed in enumerate(review_embeds):
@@ -2103,9 +2679,7 @@ async def workreview_command(ctx):
         print("✅ Work review sent successfully")
         
     except Exception as e:
-        print(f"❌ Work review command error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Work review command error: %s", e)
         await ctx.send("💼 Work review unavailable. Please try again.")
 
 # ============================================================================
@@ -2135,7 +2709,7 @@ async def send_automated_work_briefing():
     """Automatically send 9 AM work briefing to specific channel (weekdays only)"""
     try:
         # Check if it's a weekday (Monday=0, Sunday=6)
-        toronto_tz = pytz.timezone('America/Toronto')
+        toronto_tz = TORONTO_TZ
         current_day = datetime.now(toronto_tz).weekday()
         
         if current_day >= 5:  # Saturday=5, Sunday=6
@@ -2150,7 +2724,7 @@ async def send_automated_work_briefing():
             print(f"🌅 Automated work briefing (weekday) - sending to #{target_channel.name}")
             
             # Generate the comprehensive briefing embeds
-            briefing_embeds = generate_work_briefing_embeds(briefing_type="morning")
+            briefing_embeds = await asyncio.to_thread(generate_work_briefing_embeds, "morning")
             
             # Send each embed with a small delay for better presentation
             for i, embed in enumerate(briefing_embeds):
@@ -2170,7 +2744,7 @@ async def send_automated_work_review():
     """Automatically send 4:30 PM work review to specific channel (weekdays only)"""
     try:
         # Check if it's a weekday (Monday=0, Sunday=6)
-        toronto_tz = pytz.timezone('America/Toronto')
+        toronto_tz = TORONTO_TZ
         current_day = datetime.now(toronto_tz).weekday()
         
         if current_day >= 5:  # Saturday=5, Sunday=6
@@ -2185,7 +2759,7 @@ async def send_automated_work_review():
             print(f"🌆 Automated work review (weekday) - sending to #{target_channel.name}")
             
             # Generate the review briefing embeds
-            review_embeds = generate_work_briefing_embeds(briefing_type="review")
+            review_embeds = await asyncio.to_thread(generate_work_briefing_embeds, "review")
             
             # Send each embed with a small delay for better presentation
             for i, embed in enumerate(review_embeds):
@@ -2208,7 +2782,7 @@ async def priority_emails_command(ctx, max_emails: int = 5):
     try:
         async with ctx.typing():
             max_emails = max(1, min(max_emails, 10))  # Limit between 1-10
-            emails = get_priority_emails(max_emails)
+            emails = await asyncio.to_thread(get_priority_emails, max_emails)
             await ctx.send(emails)
     except Exception as e:
         print(f"❌ Priority emails command error: {e}")
@@ -2220,7 +2794,7 @@ async def email_status_command(ctx):
     
     try:
         async with ctx.typing():
-            metrics = get_email_metrics()
+            metrics = await asyncio.to_thread(get_email_metrics)
             await ctx.send(metrics)
     except Exception as e:
         print(f"❌ Email status command error: {e}")
@@ -2280,9 +2854,20 @@ async def test_work_review_command(ctx):
 # MAIN EXECUTION
 # ============================================================================
 
+async def main():
+    """Run the bot, closing the shared HTTP session on shutdown"""
+    discord.utils.setup_logging()
+    try:
+        async with bot:
+            await bot.start(DISCORD_TOKEN)
+    finally:
+        await close_http_session()
+
 if __name__ == "__main__":
     try:
-        bot.run(DISCORD_TOKEN)
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         print(f"❌ CRITICAL: Bot failed to start: {e}")
         exit(1)
\ No newline at end of file
@@ -0,0 +1,35 @@
+import os
+import sys
+
+# main.py reads its config at import - dummy values are enough to exercise pure helpers
+os.environ.setdefault('DISCORD_TOKEN', 'test-token')
+os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+os.environ.setdefault('VIVIAN_ASSISTANT_ID', 'asst_test')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import LRUDict
+
+
+def test_get_refreshes_recency():
+    cache = LRUDict(2)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache.get('a') == 1
+    cache['c'] = 3
+    assert 'a' in cache
+    assert 'b' not in cache
+
+
+def test_get_missing_key_returns_default():
+    cache = LRUDict(2)
+    assert cache.get('missing') is None
+    assert cache.get('missing', 0) == 0
+
+
+def test_eviction_calls_on_evict():
+    evicted = []
+    cache = LRUDict(1, on_evict=lambda key, value: evicted.append((key, value)))
+    cache['a'] = 1
+    cache['b'] = 2
+    assert evicted == [('a', 1)]
+    assert list(cache) == ['b']